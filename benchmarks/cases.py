@@ -0,0 +1,139 @@
+from typing import Annotated, Any, Callable, Optional
+
+import spec
+
+from .to_dict import DEEP, WIDE, Deep, Wide
+
+class Flat(spec.Model):
+    id: int
+    name: str
+    score: float
+    active: bool
+    note: Optional[str]
+
+class Numbers(spec.Model):
+    values: list[int]
+
+class Entry(spec.Model):
+    id: int
+    name: str
+
+class Registry(spec.Model):
+    entries: dict[str, Entry]
+
+class CachedEntry(spec.Model, cache=True):
+    id: int
+    name: str
+
+class CachedRegistry(spec.Model, cache=True):
+    entries: dict[str, CachedEntry]
+
+class Created(spec.Model):
+    id: int
+    name: str
+
+class Deleted(spec.Model):
+    id: int
+    reason: str
+
+class Untagged(spec.Model):
+    event: Created | Deleted
+
+class External(spec.Model):
+    event: Annotated[Created | Deleted, spec.tag("external")]
+
+class Internal(spec.Model):
+    event: Annotated[Created | Deleted, spec.tag("internal", tag="type")]
+
+class Adjacent(spec.Model):
+    event: Annotated[Created | Deleted, spec.tag("adjacent", tag="type", content="data")]
+
+FLAT = {"id": 1, "name": "flat", "score": 1.5, "active": True, "note": None}
+NUMBERS = {"values": list(range(100_000))}
+REGISTRY = {"entries": {str(i): {"id": i, "name": str(i)} for i in range(1_000)}}
+DELETED = {"id": 1, "reason": "spam"}
+
+UNIONS: dict[str, tuple[type[spec.Model], dict[str, Any]]] = {
+    "untagged": (Untagged, {"event": DELETED}),
+    "external": (External, {"event": {"Deleted": DELETED}}),
+    "internal": (Internal, {"event": {"type": "Deleted", **DELETED}}),
+    "adjacent": (Adjacent, {"event": {"type": "Deleted", "data": DELETED}}),
+}
+
+MODELS: dict[str, tuple[type[spec.Model], dict[str, Any]]] = {
+    "flat": (Flat, FLAT),
+    "deep": (Deep, DEEP.to_dict()),
+    "wide": (Wide, WIDE.to_dict()),
+    "list_int": (Numbers, NUMBERS),
+    "dict_model": (Registry, REGISTRY),
+    **{f"union_{name}": case for name, case in UNIONS.items()},
+}
+
+def invalid(value: Any) -> Any:
+    # swaps the last scalar in the payload for a value of the wrong type, so the failure
+    # happens as deep inside the payload as possible
+    if isinstance(value, dict) and value:
+        key = next(reversed(value))
+
+        return {**value, key: invalid(value[key])}
+
+    if isinstance(value, list) and value:
+        return [*value[:-1], invalid(value[-1])]
+
+    return object()
+
+def construct(cls: type[spec.Model], data: dict[str, Any]) -> Callable[[], Any]:
+    return lambda: cls(data)
+
+def to_dict(cls: type[spec.Model], data: dict[str, Any]) -> Callable[[], Any]:
+    instance = cls(data)
+
+    return instance.to_dict
+
+def eq(cls: type[spec.Model], data: dict[str, Any]) -> Callable[[], Any]:
+    a, b = cls(data), cls(data)
+
+    return lambda: a == b
+
+def failure(cls: type[spec.Model], data: dict[str, Any]) -> Callable[[], Any]:
+    bad = invalid(data)
+
+    def run() -> str:
+        try:
+            cls(bad)
+        except spec.SpecError as e:
+            return str(e)
+
+        raise AssertionError(f"{cls.__name__} accepted invalid data")
+
+    return run
+
+def cached(cls: type[spec.Model], data: dict[str, Any]) -> Callable[[], Any]:
+    instance = cls(data)
+    instance.to_dict()
+
+    return instance.to_dict
+
+def changed(cls: type[spec.Model], data: dict[str, Any]) -> Callable[[], Any]:
+    # one nested model changes between calls, everything else comes from the cache
+    instance = cls(data)
+    entry = next(iter(instance.entries.values()))  # type: ignore
+
+    def run() -> Any:
+        entry.id += 1
+
+        return instance.to_dict()
+
+    return run
+
+def collect() -> dict[str, Callable[[], Any]]:
+    benchmarks: dict[str, Callable[[], Any]] = {}
+
+    for name, (cls, data) in MODELS.items():
+        for kind in (construct, to_dict, eq, failure):
+            benchmarks[f"{kind.__name__}.{name}"] = kind(cls, data)
+
+    for kind in (cached, changed):
+        benchmarks[f"to_dict.dict_model_{kind.__name__}"] = kind(CachedRegistry, REGISTRY)
+
+    return benchmarks
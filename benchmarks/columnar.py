@@ -0,0 +1,44 @@
+import timeit
+
+import spec
+
+class Row(spec.Model):
+    id: int
+    score: float
+    active: bool
+    name: str
+
+ROWS = [Row({"id": i, "score": i / 3, "active": i % 2 == 0, "name": f"row {i}"}) for i in range(200_000)]
+
+def pivot() -> dict[str, list]:
+    columns: dict[str, list] = {key: [] for key in Row._items}
+
+    for row in ROWS:
+        for key, value in row.to_dict().items():
+            columns[key].append(value)
+
+    return columns
+
+def to_columns() -> dict[str, object]:
+    return spec.to_columns(Row, ROWS, backend="array")
+
+def to_columns_offsets() -> dict[str, object]:
+    return spec.to_columns(Row, ROWS, backend="array", strings="offsets")
+
+COLUMNS = spec.to_columns(Row, ROWS, backend="array")
+LISTS = {key: [getattr(row, key) for row in ROWS] for key in Row._items}
+
+def from_rows() -> list[Row]:
+    keys = list(LISTS)
+
+    return [Row(dict(zip(keys, values))) for values in zip(*LISTS.values())]
+
+def from_columns() -> list[Row]:
+    return spec.from_columns(Row, COLUMNS)
+
+if __name__ == "__main__":
+    assert from_rows() == from_columns() == ROWS
+
+    for f in (pivot, to_columns, to_columns_offsets, from_rows, from_columns):
+        best = min(timeit.repeat(f, number=1, repeat=3))
+        print(f"{f.__name__:<20}{best * 1000:8.2f}ms per {len(ROWS)} rows")
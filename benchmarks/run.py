@@ -0,0 +1,71 @@
+import argparse
+import json
+import pathlib
+import sys
+import timeit
+from typing import Any, Callable
+
+from .cases import collect
+
+BASELINE = pathlib.Path(__file__).with_name("baseline.json")
+
+def calibrate() -> float:
+    # a fixed pure python workload, timings are stored relative to it so baselines
+    # recorded on another machine can still be compared
+    def work() -> int:
+        total = 0
+
+        for i in range(10_000):
+            total += len({"a": i, "b": str(i)})
+
+        return total
+
+    return min(timeit.repeat(work, number=10, repeat=5)) / 10
+
+def measure(f: Callable[[], Any], repeat: int) -> float:
+    number, _ = timeit.Timer(f).autorange()
+
+    return min(timeit.repeat(f, number=number, repeat=repeat)) / number
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Runs the spec benchmarks and compares them against the stored baseline")
+    parser.add_argument("-k", "--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before a benchmark counts as a regression")
+    parser.add_argument("--save", action="store_true", help="store the results as the new baseline")
+    args = parser.parse_args()
+
+    unit = calibrate()
+    baseline: dict[str, float] = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+    results: dict[str, float] = {}
+    regressions: list[str] = []
+
+    for name, f in collect().items():
+        if args.filter not in name:
+            continue
+
+        results[name] = relative = measure(f, args.repeat) / unit
+        line = f"{name:<32}{relative * unit * 1_000_000:12.2f}us"
+
+        if (previous := baseline.get(name)) is not None:
+            change = relative / previous - 1
+            line += f"{change:+10.1%}"
+
+            if change > args.tolerance:
+                regressions.append(name)
+                line += "  REGRESSION"
+
+        print(line)
+
+    if args.save:
+        BASELINE.write_text(json.dumps({**baseline, **results}, indent=4, sort_keys=True) + "\n")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+import argparse
+import pathlib
+import subprocess
+import sys
+import tempfile
+
+ROOT = pathlib.Path(__file__).parent.parent
+
+def generate(count: int, defer: bool) -> str:
+    # a schema module shaped like a large service: scalars, containers, optionals, references
+    # to earlier models and tagged unions
+    lines = ["from typing import Annotated, Optional", "", "import spec", ""]
+    options = ", defer=True" if defer else ""
+
+    for i in range(count):
+        lines.append(f"class Model{i}(spec.Model{options}):")
+        lines.append("    id: int")
+        lines.append("    name: str")
+        lines.append("    tags: list[str]")
+        lines.append("    score: Optional[float]")
+        lines.append("    attributes: dict[str, int]")
+
+        if i >= 2:
+            lines.append(f"    parent: Model{i - 1}")
+            lines.append(f"    children: list[Model{i - 2}]")
+            lines.append(f"    either: Annotated[Model{i - 1} | Model{i - 2}, spec.tag(\"external\")]")
+
+        lines.append("")
+
+    return "\n".join(lines)
+
+def measure(count: int, defer: bool, repeat: int) -> float:
+    with tempfile.TemporaryDirectory() as directory:
+        (pathlib.Path(directory) / "schema.py").write_text(generate(count, defer))
+
+        script = "import time; import spec; start = time.perf_counter(); import schema; print(time.perf_counter() - start)"
+        env_path = f"{directory}:{ROOT}"
+
+        times = [
+            float(subprocess.run([sys.executable, "-c", script], env={"PYTHONPATH": env_path}, capture_output=True, text=True, check=True).stdout)
+            for _ in range(repeat)
+        ]
+
+    return min(times)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Times importing a generated module with many models")
+    parser.add_argument("--count", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    for defer in (False, True):
+        best = measure(args.count, defer, args.repeat)
+        print(f"{'defer' if defer else 'eager':<8}{best * 1000:10.2f}ms to import {args.count} models")
@@ -0,0 +1,31 @@
+import timeit
+
+import spec
+
+class Inner(spec.Model):
+    value: int
+
+class Record(spec.Model):
+    id: int
+    name: str
+    tags: list[str]
+    inner: Inner
+    score: float | None
+
+RECORDS = [
+    {"id": i, "name": f"record {i}", "tags": ["a", "b"], "inner": {"value": i}, "score": i / 2 if i % 2 else None}
+    for i in range(10_000)
+]
+
+def loop() -> list[Record]:
+    return [Record(record) for record in RECORDS]
+
+def validate_many() -> list[Record]:
+    return Record.validate_many(RECORDS)
+
+if __name__ == "__main__":
+    assert loop() == validate_many()
+
+    for f in (loop, validate_many):
+        best = min(timeit.repeat(f, number=5, repeat=5)) / 5
+        print(f"{f.__name__:<16}{best * 1000:8.2f}ms per {len(RECORDS)} records")
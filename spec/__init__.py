@@ -5,5 +5,10 @@
 from .errors import *
 from .model import *
 from .item import *
+from .parallel import *
+from .stream import *
+from .columnar import *
+from .tracking import *
+from . import profiling
 
 __version__ = "0.0.1"
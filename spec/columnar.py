@@ -0,0 +1,276 @@
+from __future__ import annotations
+
+from array import array
+from itertools import accumulate, repeat
+from operator import attrgetter, itemgetter
+from typing import Any, Iterable, Iterator, Literal, Mapping, Sequence, TypeVar
+
+from .errors import FailedValidation, InvalidType, MissingRequiredKey, PathError, UnknownKey
+from .item import InternalItem, always_valid, identity
+from .model import Model, _simple_type, is_model
+from .util import Missing, get_origin
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+__all__ = ("StringColumn", "to_columns", "from_columns")
+
+M = TypeVar("M", bound=Model)
+
+Backend = Literal["auto", "array", "numpy"]
+
+ARRAY_TYPECODES: dict[type, str] = {int: "q", float: "d", bool: "b"}
+NUMPY_DTYPES: dict[type, str] = {int: "int64", float: "float64", bool: "bool"}
+
+# the array typecodes and numpy dtype kinds whose values are always an instance of the field type
+ACCEPTED_TYPECODES: dict[type, str] = {int: "bBhHiIlLqQ", float: "fd", bool: "", str: "uw"}
+ACCEPTED_KINDS: dict[type, str] = {int: "iub", float: "f", bool: "b", str: "U"}
+
+class StringColumn:
+    # the strings of a column as one utf-8 buffer, string `i` is `data[offsets[i]:offsets[i + 1]]`
+    __slots__ = ("offsets", "data")
+
+    def __init__(self, offsets: Any, data: bytes):
+        self.offsets = offsets
+        self.data = data
+
+    @classmethod
+    def from_strings(cls, strings: Iterable[str], *, use_numpy: bool = False) -> StringColumn:
+        strings = strings if isinstance(strings, list) else list(strings)
+        joined = "".join(strings)
+
+        # ascii text has as many bytes as characters so nothing needs to be encoded one by one
+        if joined.isascii():
+            data = joined.encode("ascii")
+            offsets = accumulate(map(len, strings), initial=0)
+        else:
+            encoded = [string.encode() for string in strings]
+            data = b"".join(encoded)
+            offsets = accumulate(map(len, encoded), initial=0)
+
+        if use_numpy:
+            return cls(numpy.fromiter(offsets, dtype="int64", count=len(strings) + 1), data)  # type: ignore
+
+        return cls(array("q", offsets), data)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += len(self)
+
+        return self.data[self.offsets[index]:self.offsets[index + 1]].decode()
+
+    def __iter__(self) -> Iterator[str]:
+        data = self.data
+        offsets = self.offsets
+
+        for start, end in zip(offsets, offsets[1:]):
+            yield data[start:end].decode()
+
+    def __repr__(self) -> str:
+        return f"<StringColumn length={len(self)} bytes={len(self.data)}>"
+
+def _column_type(item: InternalItem[Any]) -> type | None:
+    # only fields which are nothing more than a primitive type are stored in typed columns
+    ty = _simple_type(item)
+
+    return ty if ty in (int, float, bool, str) else None
+
+def _raw_values(cls: type[Model], rows: Sequence[dict[str, Any]], key: str, item: InternalItem[Any]) -> list[Any]:
+    if item.default:
+        default = item.default
+
+        return [row[key] if key in row else default() for row in rows]
+
+    try:
+        return list(map(itemgetter(key), rows))
+    except KeyError:
+        index = next(i for i, row in enumerate(rows) if key not in row)
+        error = MissingRequiredKey(cls, key)
+        error._at(index)
+
+        raise error from None
+
+def _check_column(cls: type[Model], key: str, item: InternalItem[Any], values: list[Any], ty: type) -> None:
+    if all(map(isinstance, values, repeat(ty))):
+        return
+
+    index, value = next((i, value) for i, value in enumerate(values) if not isinstance(value, ty))
+    error = InvalidType(cls, item, value)
+    error._field(key)
+    error._at(index)
+
+    raise error
+
+def to_columns(cls: type[Model], rows: Iterable[Model | dict[str, Any]], *, backend: Backend = "auto", strings: Literal["object", "offsets"] = "object") -> dict[str, Any]:
+    # columns are keyed like `to_dict`. int, float and bool fields become `array.array`s or numpy arrays,
+    # str fields become lists or object arrays, or a `StringColumn` with `strings="offsets"`, and every
+    # other field is a list of its values. raw dicts only have their typed columns checked
+    if backend == "numpy" and numpy is None:
+        raise ImportError("numpy is required for backend=\"numpy\"")
+
+    use_numpy = numpy is not None and backend != "array"
+    rows = rows if isinstance(rows, list) else list(rows)
+    instances = bool(rows) and isinstance(rows[0], Model)
+    columns: dict[str, Any] = {}
+
+    for key, item in cls._items.items():
+        ty = _column_type(item)
+
+        if instances:
+            values = list(map(attrgetter(item.key), rows))
+        else:
+            values = _raw_values(cls, rows, key, item)  # type: ignore
+
+            if ty is not None:
+                _check_column(cls, key, item, values, ty)
+
+        if ty is str and strings == "offsets":
+            columns[key] = StringColumn.from_strings(values, use_numpy=use_numpy)
+
+        elif ty is not None and ty is not str:
+            if use_numpy:
+                columns[key] = numpy.array(values, dtype=NUMPY_DTYPES[ty])  # type: ignore
+            else:
+                columns[key] = array(ARRAY_TYPECODES[ty], values)
+
+        elif use_numpy:
+            column = numpy.empty(len(values), dtype=object)  # type: ignore
+            column[:] = values
+            columns[key] = column
+
+        else:
+            columns[key] = values
+
+    return columns
+
+def _primitive_type(item: InternalItem[Any]) -> type | None:
+    # like `_column_type` but validators and hooks are allowed, they are applied to the column after
+    ty = item.ty
+
+    if isinstance(ty, list) or is_model(ty) or item.internal_items:
+        return None
+
+    origin = get_origin(ty)
+
+    return origin if origin in (int, float, bool, str) else None
+
+def _as_list(column: Any) -> list[Any]:
+    if isinstance(column, list):
+        return column
+
+    # numpy arrays and `array.array`s both convert their values to python objects with `tolist`
+    if hasattr(column, "tolist"):
+        return column.tolist()
+
+    return list(column)
+
+def _primitive_column(cls: type[Model], key: str, item: InternalItem[Any], column: Any, ty: type) -> list[Any]:
+    if numpy is not None and isinstance(column, numpy.ndarray):
+        checked = column.dtype.kind in ACCEPTED_KINDS[ty]
+    elif isinstance(column, array):
+        checked = column.typecode in ACCEPTED_TYPECODES[ty]
+    else:
+        checked = False
+
+    values = _as_list(column)
+
+    if ty is bool and isinstance(column, array) and column.typecode in "bB":
+        # `to_columns` stores bools as bytes, which are fine as long as they are all 0 or 1
+        if not set(values) <= {0, 1}:
+            index, value = next((i, value) for i, value in enumerate(values) if value not in (0, 1))
+            error = InvalidType(cls, item, value)
+            error._field(key)
+            error._at(index)
+
+            raise error
+
+        values = list(map(bool, values))
+
+    elif not checked:
+        _check_column(cls, key, item, values, ty)
+
+    if (validate := item.validate) is not always_valid and not all(map(validate, values)):
+        index, value = next((i, value) for i, value in enumerate(values) if not validate(value))
+        error = FailedValidation(cls, item, value)
+        error._field(key)
+        error._at(index)
+
+        raise error
+
+    if item.hook is not identity:
+        values = list(map(item.hook, values))
+
+    return values
+
+def _validated_column(cls: type[Model], instances: list[Model], key: str, validator: Any, column: Any) -> list[Any]:
+    output: list[Any] = []
+    append = output.append
+
+    try:
+        for instance, value in zip(instances, _as_list(column)):
+            append(validator(instance, value))
+    except PathError as e:
+        e._in(cls, key)
+        e._at(len(output))
+        raise
+
+    return output
+
+def from_columns(cls: type[M], columns: Mapping[str, Any]) -> list[M]:
+    # the reverse of `to_columns`, takes lists, `array.array`s or numpy arrays keyed like `to_dict`.
+    # int, float, bool and str fields are type checked a whole column at a time, which is skipped
+    # entirely for arrays with a matching typecode or dtype, everything else is validated per value
+    if cls._is_async:
+        raise TypeError(f"{cls.__name__} has async validators or hooks, which columns dont support")
+
+    lengths = {len(column) for column in columns.values()}
+
+    if len(lengths) > 1:
+        raise ValueError(f"columns passed to {cls.__name__} have different lengths {sorted(lengths)}")
+
+    length = lengths.pop() if lengths else 0
+    new = cls.__new__
+    instances = [new(cls) for _ in range(length)]
+    set_field = object.__setattr__
+
+    if cls._tagged:
+        for instance in instances:
+            set_field(instance, "__tag_map__", {})
+
+    for key, attr, validator in cls._plan:
+        item = cls._items[key]
+
+        if (column := columns.get(key, Missing)) is Missing:
+            if not item.default:
+                if length:
+                    raise MissingRequiredKey(cls, key)
+
+                continue
+
+            default = item.default
+            values = [default() for _ in range(length)]
+
+        elif (ty := _primitive_type(item)) is not None:
+            values = _primitive_column(cls, key, item, column, ty)
+
+        else:
+            values = _validated_column(cls, instances, key, validator, column)  # type: ignore
+
+        for instance, value in zip(instances, values):
+            set_field(instance, attr, value)
+
+    extra = [key for key in columns if key not in cls._items] if cls._extra != "ignore" else []
+
+    if extra and cls._extra == "forbid":
+        raise UnknownKey(cls, extra)
+
+    if cls._extra == "collect":
+        for i, instance in enumerate(instances):
+            set_field(instance, "__extra__", {key: columns[key][i] for key in extra})
+
+    return instances
@@ -1,22 +1,144 @@
-__all__ = ("SpecError", "MissingArgument", "MissingRequiredKey", "InvalidType", "FailedValidation", "UnknownUnionKey", "MissingTypeName")
+from __future__ import annotations
+
+import pickle
+from typing import TYPE_CHECKING, Any
+
+from .util import pretty_type, generate_type_from_data
+
+if TYPE_CHECKING:
+    from .item import InternalItem
+    from .model import Model
+
+__all__ = ("SpecError", "PathError", "MissingArgument", "MissingRequiredKey", "InvalidType", "FailedValidation", "UnknownKey", "UnknownUnionKey", "MissingTypeName", "FrozenInstance")
 
 class SpecError(Exception):
-    pass
+    _message: str | None = None
+
+    def __str__(self) -> str:
+        if self._message is None:
+            self._message = self._render()
+
+        return self._message
+
+    def _render(self) -> str:
+        return super().__str__()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # items hold validators and hooks which often can't be pickled, and so can values, so every
+        # attribute is checked on its own and sent as None when it can't be. the message is rendered
+        # first as it might need them
+        state: dict[str, Any] = {}
+        message = str(self)
+
+        for name, value in vars(self).items():
+            try:
+                pickle.dumps(value)
+            except Exception:
+                value = None
+
+            state[name] = value
+
+        state["_message"] = message
+
+        return (_restore, (self.__class__, self.args, state))
+
+def _restore(cls: type[SpecError], args: tuple[Any, ...], state: dict[str, Any]) -> SpecError:
+    error = cls.__new__(cls)
+    error.args = args
+    error.__dict__.update(state)
+
+    return error
 
 class MissingArgument(SpecError):
     pass
 
-class MissingRequiredKey(SpecError):
-    pass
+# the errors below are raised and discarded constantly while resolving unions, so they only keep
+# what went wrong and build their message the first time it is asked for. the path to the bad value
+# is filled in innermost first as the error propagates out of containers and models
 
-class InvalidType(SpecError):
-    pass
+class PathError(SpecError):
+    def __init__(self, model: type[Model]):
+        # `args` stays empty, the data is only kept on attributes so the message can be built later
+        super().__init__()
 
-class FailedValidation(SpecError):
-    pass
+        self.model = model
+        self._segments: list[tuple[bool, Any]] = []
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self)!r})"
+
+    def _at(self, segment: Any) -> None:
+        # an index into a list or a key of a dict
+        self._segments.append((False, segment))
+
+    def _field(self, key: str) -> None:
+        self._segments.append((True, key))
+
+    def _in(self, model: type[Model], key: str) -> None:
+        self._segments.append((True, key))
+        self.model = model
+
+    @property
+    def path(self) -> list[Any]:
+        return [segment for _, segment in reversed(self._segments)]
+
+    @property
+    def location(self) -> str:
+        parts = [self.model.__name__]
+
+        for is_field, segment in reversed(self._segments):
+            if is_field:
+                parts.append(f".{segment}")
+            else:
+                parts.append(f"[{segment!r}]")
+
+        return "".join(parts)
+
+class MissingRequiredKey(PathError):
+    def __init__(self, model: type[Model], key: str):
+        super().__init__(model)
+
+        self.key = key
+
+    def _render(self) -> str:
+        return f"Missing required key {self.location}.{self.key}"
+
+class InvalidType(PathError):
+    def __init__(self, model: type[Model], item: InternalItem[Any], value: Any):
+        super().__init__(model)
+
+        self.item = item
+        self.value = value
+
+    def _render(self) -> str:
+        return f"{self.location} expected type {pretty_type(self.item)} but found {generate_type_from_data(self.value)}"
+
+class FailedValidation(PathError):
+    def __init__(self, model: type[Model], item: InternalItem[Any], value: Any):
+        super().__init__(model)
+
+        self.item = item
+        self.value = value
+
+    def _render(self) -> str:
+        return f"{self.location} failed validation"
+
+class UnknownKey(PathError):
+    def __init__(self, model: type[Model], keys: list[str]):
+        super().__init__(model)
+
+        self.keys = keys
+
+    def _render(self) -> str:
+        location = self.location
+
+        return f"Unknown key{'s' if len(self.keys) > 1 else ''} {', '.join(f'{location}.{key}' for key in self.keys)}"
 
 class UnknownUnionKey(SpecError):
     pass
 
 class MissingTypeName(SpecError):
     pass
+
+class FrozenInstance(SpecError, AttributeError):
+    pass
@@ -9,7 +9,14 @@ __all__ = ("Item", "InternalItem", "rename", "default", "validate", "hook", "tag
 
 T = TypeVar("T", default=Any)
 
-@dataclass
+def always_valid(_: Any) -> bool:
+    return True
+
+def identity(value: T) -> T:
+    return value
+
+# compared by identity so items can be part of hashable `Annotated` annotations
+@dataclass(eq=False)
 class Item(Generic[T]):
     _key: str | None = None
     _rename: str | None = None
@@ -17,17 +24,18 @@ class Item(Generic[T]):
     _internal_items: list[InternalItem] | None = None
     _default: Callable[[], T] | None = None
     _modified: list[str] = field(default_factory=lambda: [])
-    _validate: Callable[[T], bool] = lambda _: True
-    _hook: Callable[[T], T] = lambda x: x
+    _validate: Callable[[T], bool] = always_valid
+    _hook: Callable[[T], T] = identity
     _tag: Literal["untagged", "external", "internal", "adjacent"] = "untagged"
     _tag_info: dict[str, Any] = field(default_factory=lambda: {})
     _type_name: str | None = None
+    _variants: dict[str, InternalItem] = field(default_factory=lambda: {})
 
     def _to_internal(self) -> InternalItem[T]:
         assert self._key is not None
         assert self._ty is not None
 
-        return InternalItem(self._key, self._rename, self._ty, self._internal_items or [], self._default, self._validate, self._hook, self._tag, self._tag_info, self._type_name)
+        return InternalItem(self._key, self._rename, self._ty, self._internal_items or [], self._default, self._validate, self._hook, self._tag, self._tag_info, self._type_name, self._variants)
 
     def rename(self, key: str) -> Self:
         self._rename = key
@@ -95,6 +103,8 @@ class InternalItem(Generic[T]):
     tag: Literal["untagged", "external", "internal", "adjacent"]
     tag_info: dict[str, Any]
     type_name: str | None
+    variants: dict[str, InternalItem] = field(default_factory=lambda: {})
+    validator: Callable[..., T] | None = field(default=None, repr=False, compare=False)
 
     @property
     def actual_key(self) -> str:
@@ -1,233 +1,1136 @@
 from __future__ import annotations
 
-from typing import Annotated, Any, Generic, TypeAlias, TypeGuard, TypeVar, get_args
+import asyncio
+import io
+from dataclasses import replace
+from inspect import isawaitable, iscoroutinefunction
+from itertools import repeat
+from operator import attrgetter, is_
+from typing import IO, Annotated, Any, Awaitable, Callable, Coroutine, Generic, Iterable, Iterator, Literal, Mapping, NoReturn, Self, TypeAlias, TypeGuard, TypeVar, get_args, overload
 from types import NoneType
+from json import JSONEncoder
+from json.encoder import c_make_encoder, encode_basestring, encode_basestring_ascii  # type: ignore
 
-from .errors import MissingArgument, MissingRequiredKey, InvalidType, FailedValidation, MissingTypeName, SpecError, UnknownUnionKey
-from .item import Item, InternalItem
-from .util import get_origin, get_original_bases, get_type_name, pretty_type, generate_type_from_data, _Missing, Missing, is_union
+from .errors import PathError, MissingArgument, MissingRequiredKey, InvalidType, FailedValidation, MissingTypeName, SpecError, UnknownUnionKey, UnknownKey, FrozenInstance
+from .item import Item, InternalItem, always_valid, identity
+from .profiling import StatsKey, profiler
+from .tracking import UNTRACKED, TrackedDict, TrackedList, TrackedSet, invalidate, link
+from .util import get_origin, get_original_bases, get_type_name, pretty_type, Missing, is_union
 
-__all__ = ("is_model", "generate_invalid_type", "validate", "convert_to_item", "value_to_dict", "RenameBase", "Default", "Upper", "CamelCase", "PascalCase", "KebabCase", "ScreamingKebabCase", "RenameScheme", "Model", "TransparentModel", "transparent")
+__all__ = ("is_model", "generate_invalid_type", "validate", "compile_validator", "compile_async_validator", "is_async", "compile_builder", "convert_to_item", "schema_item", "clear_schema_cache", "value_to_dict", "compile_serializer", "JSONWriter", "dump_json", "RenameBase", "Default", "Upper", "CamelCase", "PascalCase", "KebabCase", "ScreamingKebabCase", "RenameScheme", "is_tagged", "is_plain", "LazyField", "ModelMeta", "Model", "TransparentModel", "transparent")
 
 T = TypeVar("T")
 
 def is_model(obj: Any) -> TypeGuard[type[Model]]:
     return isinstance(obj, type) and issubclass(obj, Model)
 
-def generate_invalid_type(model: Model, item: InternalItem, root_item: InternalItem, root_value: Any) -> InvalidType:
-    return InvalidType(f"{model.__class__.__name__}.{item.key} expected type {pretty_type(root_item)} but found {generate_type_from_data(root_value)}")
+def generate_invalid_type(model: Model, item: InternalItem, value: Any) -> InvalidType:
+    return InvalidType(model.__class__, item, value)
 
-def validate(item: InternalItem[Any], model: Model, value: Any, root_item: InternalItem | None = None, root_value: Any | _Missing = Missing) -> Any:
-    root_item = root_item or item
-    root_value = root_value or value
+Validator: TypeAlias = Callable[["Model", Any], Any]
+Instrument: TypeAlias = Callable[[str, Validator], Validator]
 
-    if is_model(item.ty):
-        return item.ty(value)
+def validate(item: InternalItem[Any], model: Model, value: Any) -> Any:
+    if item.validator is None:
+        item.validator = compile_validator(item)
+
+    try:
+        return item.validator(model, value)
+    except PathError as e:
+        e._field(item.key)
+        raise
+
+def _item_validator(item: InternalItem[Any], instrument: Instrument | None) -> Validator:
+    # validators dont depend on where the item is used so the one cached on the item is shared,
+    # unless this is being compiled for a profiled model
+    if instrument is not None:
+        return compile_validator(item, instrument)
+
+    if item.validator is None:
+        item.validator = compile_validator(item)
+
+    return item.validator
+
+def compile_validator(item: InternalItem[Any], instrument: Instrument | None = None) -> Validator:
+    # all type inspection happens here so the returned closure only runs the checks needed for this item
+    ty = item.ty
+
+    if is_model(ty):
+        if issubclass(ty, TransparentModel):
+            def validate_transparent(model: Model, value: Any) -> Any:
+                if isinstance(value, ty):
+                    return value
+
+                return ty(value)
+
+            return validate_transparent
+
+        def validate_model(model: Model, value: Any) -> Any:
+            if not isinstance(value, dict):
+                # already built instances are kept as they are, they were validated when they were made
+                if isinstance(value, ty):
+                    return value
+
+                raise InvalidType(model.__class__, item, value)
+
+            return ty(value)
+
+        return validate_model
+
+    if isinstance(ty, list):
+        check = _compile_union(item, instrument)
+    else:
+        check = _compile_type(item, instrument)
+
+    item_validate = item.validate
+    item_hook = item.hook
+
+    if item_validate is always_valid and item_hook is identity:
+        return check
+
+    if iscoroutinefunction(item_validate) or iscoroutinefunction(item_hook):
+        def validate_async_only(model: Model, value: Any) -> Any:
+            raise TypeError(f"{model.__class__.__name__}.{item.key} has an async validator or hook, use `await {model.__class__.__name__}.avalidate(...)`")
+
+        return validate_async_only
+
+    def validate_item(model: Model, value: Any) -> Any:
+        value = check(model, value)
+
+        if not item_validate(value):
+            raise FailedValidation(model.__class__, item, value)
+
+        return item_hook(value)
 
+    return validate_item
+
+def _simple_type(item: InternalItem[Any]) -> type | None:
+    # the type to check against when validating the item is nothing more than an isinstance check
+    ty = item.ty
+
+    if is_model(ty) or isinstance(ty, list) or item.validate is not always_valid or item.hook is not identity:
+        return None
+
+    origin = get_origin(ty)
+
+    if not isinstance(origin, type) or (origin in (list, set, tuple, dict) and item.internal_items):
+        return None
+
+    return origin
+
+def _invalid_element(model: Model, item: InternalItem[Any], value: Iterable[Any], ty: type, indexed: bool) -> InvalidType:
+    # only runs once a bulk check failed, finds which value it was so the error can point at it
+    for index, element in enumerate(value):
+        if not isinstance(element, ty):
+            error = InvalidType(model.__class__, item, element)
+
+            if indexed:
+                error._at(index)
+
+            return error
+
+    raise AssertionError("no invalid element")
+
+def _invalid_value(model: Model, item: InternalItem[Any], value: dict[Any, Any], ty: type) -> InvalidType:
+    for key, element in value.items():
+        if not isinstance(element, ty):
+            error = InvalidType(model.__class__, item, element)
+            error._at(key)
+
+            return error
+
+    raise AssertionError("no invalid value")
+
+def _compile_type(item: InternalItem[Any], instrument: Instrument | None = None) -> Validator:
     origin = get_origin(item.ty)
 
-    if isinstance(item.ty, list):
-        match item.tag:
-            case "untagged":
-                for arg in item.ty:
-                    assert isinstance(arg, InternalItem)
-
-                    try:
-                        value = validate(arg, model, value, root_item, root_value)
-                    except SpecError:
-                        pass
-                    else:
-                        break
-                else:
-                    raise generate_invalid_type(model, item, root_item, root_value)
+    # containers are only rebuilt when validating the values inside them changed something,
+    # otherwise the original container is returned as is. errors from inside a container get the
+    # index or key added to their path on the way out
+    if origin in (list, set, tuple) and item.internal_items:
+        element_item = item.internal_items[0]
+        indexed = origin is not set
 
-            case "external":
+        if (element_type := _simple_type(element_item)) is not None:
+            def check_sequence(model: Model, value: Any) -> Any:
+                if not isinstance(value, origin):
+                    raise InvalidType(model.__class__, item, value)
+
+                if not all(map(isinstance, value, repeat(element_type))):
+                    raise _invalid_element(model, element_item, value, element_type, indexed)
+
+                return value if value.__class__ is origin else origin(value)
+
+            return check_sequence
+
+        validate_element = _item_validator(element_item, instrument)
+
+        def validate_sequence(model: Model, value: Any) -> Any:
+            if not isinstance(value, origin):
+                raise InvalidType(model.__class__, item, value)
+
+            output: list[Any] = []
+            changed = value.__class__ is not origin
+
+            try:
+                for internal_value in value:
+                    new_value = validate_element(model, internal_value)
+
+                    if new_value is not internal_value:
+                        changed = True
+
+                    output.append(new_value)
+            except PathError as e:
+                if indexed:
+                    e._at(len(output))
+
+                raise
+
+            if not changed:
+                return value
+
+            return output if origin is list else origin(output)
+
+        return validate_sequence
+
+    if origin is dict and item.internal_items:
+        key_item, value_item = item.internal_items
+
+        if (key_type := _simple_type(key_item)) is not None and (value_type := _simple_type(value_item)) is not None:
+            def check_mapping(model: Model, value: Any) -> Any:
                 if not isinstance(value, dict):
-                    raise generate_invalid_type(model, item, root_item, root_value)
+                    raise InvalidType(model.__class__, item, value)
+
+                if not all(map(isinstance, value.keys(), repeat(key_type))):
+                    raise _invalid_element(model, key_item, value.keys(), key_type, False)
+
+                if not all(map(isinstance, value.values(), repeat(value_type))):
+                    raise _invalid_value(model, value_item, value, value_type)
+
+                return value if value.__class__ is dict else dict(value)
+
+            return check_mapping
+
+        validate_key = _item_validator(key_item, instrument)
+        validate_value = _item_validator(value_item, instrument)
+
+        def validate_mapping(model: Model, value: Any) -> Any:
+            if not isinstance(value, dict):
+                raise InvalidType(model.__class__, item, value)
+
+            output: dict[Any, Any] = {}
+            changed = value.__class__ is not dict
+
+            try:
+                for internal_key, internal_value in value.items():
+                    new_key = validate_key(model, internal_key)
+                    new_value = validate_value(model, internal_value)
+
+                    if new_key is not internal_key or new_value is not internal_value:
+                        changed = True
+
+                    output[new_key] = new_value
+            except PathError as e:
+                e._at(internal_key)
+                raise
+
+            return output if changed else value
+
+        return validate_mapping
+
+    def validate_type(model: Model, value: Any) -> Any:
+        if not isinstance(value, origin):
+            raise InvalidType(model.__class__, item, value)
+
+        return value
+
+    return validate_type
+
+P = TypeVar("P")
+
+def _compile_discriminator(variants: list[InternalItem[Any]], payloads: list[P]) -> Callable[[Any], list[P]]:
+    candidates: dict[type, tuple[bool, list[tuple[frozenset[str] | None, P]]]] = {}
+
+    # narrows the variants down by the python type of the value, required keys of model variants are
+    # checked per value. the result is cached for every type seen so this only happens once per type
+    def find_candidates(value_type: type) -> tuple[bool, list[tuple[frozenset[str] | None, P]]]:
+        found: list[tuple[frozenset[str] | None, P]] = []
+
+        for variant, payload in zip(variants, payloads):
+            ty = variant.ty
+
+            if is_model(ty) and issubclass(ty, TransparentModel):
+                # the wrapped type decides what a transparent model accepts, so it is always tried
+                found.append((None, payload))
+
+            elif is_model(ty):
+                if issubclass(value_type, dict):
+                    found.append((ty._required, payload))
+                elif issubclass(value_type, ty):
+                    found.append((None, payload))
+
+            elif isinstance(ty, list) or not isinstance(origin := get_origin(ty), type) or issubclass(value_type, origin):
+                found.append((None, payload))
+
+        result = candidates[value_type] = (any(required is not None for required, _ in found), found)
+
+        return result
+
+    def discriminate(value: Any) -> list[P]:
+        value_type = type(value)
+
+        if (result := candidates.get(value_type)) is None:
+            result = find_candidates(value_type)
+
+        has_models, found = result
+
+        if has_models:
+            keys = value.keys()
+
+            return [payload for required, payload in found if required is None or keys >= required]
+
+        return [payload for _, payload in found]
+
+    return discriminate
+
+def _compile_variant(name: str, variant: InternalItem[Any], instrument: Instrument | None) -> Validator:
+    validator = _item_validator(variant, instrument)
+
+    return validator if instrument is None else instrument(name, validator)
+
+def _variant_name(variant: InternalItem[Any]) -> str:
+    return get_type_name(variant.ty) if is_model(variant.ty) else pretty_type(variant)
+
+def _compile_untagged(item: InternalItem[Any], instrument: Instrument | None = None) -> Validator:
+    variants: list[InternalItem[Any]] = item.ty  # type: ignore
+    discriminate = _compile_discriminator(variants, [_compile_variant(_variant_name(variant), variant, instrument) for variant in variants])
+
+    def validate_untagged(model: Model, value: Any) -> Any:
+        for validator in discriminate(value):
+            try:
+                return validator(model, value)
+            except SpecError:
+                pass
+
+        raise InvalidType(model.__class__, item, value)
+
+    return validate_untagged
+
+def _instance_tags(item: InternalItem[Any]) -> dict[type, str]:
+    # already built models given to a tagged union pick their variant by class
+    return {variant.ty: type_name for type_name, variant in item.variants.items() if is_model(variant.ty)}
+
+def _strict_variants(item: InternalItem[Any]) -> frozenset[str]:
+    # internally tagged variants which forbid or collect unknown keys are given their data without the tag
+    return frozenset(type_name for type_name, variant in item.variants.items() if is_model(variant.ty) and variant.ty._extra != "ignore")
+
+def _compile_union(item: InternalItem[Any], instrument: Instrument | None = None) -> Validator:
+    if item.tag == "untagged":
+        return _compile_untagged(item, instrument)
+
+    tagged: dict[str, tuple[str, Validator]] = {
+        type_name: (variant.key, _compile_variant(type_name, variant, instrument))
+        for type_name, variant in item.variants.items()
+    }
+
+    def resolve(model: Model, key: Any, value: Any, segment: Any) -> Any:
+        try:
+            field, validator = tagged[key]
+        except (KeyError, TypeError):
+            raise UnknownUnionKey(f"Unknown key found `{key}`") from None
+
+        try:
+            value = validator(model, value)
+        except PathError as e:
+            if segment is not None:
+                e._field(segment)
+
+            raise
+
+        model.__tag_map__[field] = key
+
+        return value
+
+    instances = _instance_tags(item)
+
+    def resolve_instance(model: Model, value: Any) -> Any:
+        if (key := instances.get(value.__class__)) is None:
+            raise InvalidType(model.__class__, item, value)
+
+        return resolve(model, key, value, None)
+
+    match item.tag:
+        case "external":
+            def validate_external(model: Model, value: Any) -> Any:
+                if not isinstance(value, dict):
+                    return resolve_instance(model, value)
 
                 try:
-                    key, value = next(iter(value.items()))
+                    key, content = next(iter(value.items()))
                 except StopIteration:
                     raise UnknownUnionKey(f"Unknown key found ``")
 
-                for internal_item in item.ty:
-                    assert isinstance(internal_item, InternalItem)
-                    assert internal_item.type_name
+                return resolve(model, key, content, key)
 
-                    if key == internal_item.type_name:
-                        value = validate(internal_item, model, value, root_item, root_value)
-                        model.__tag_map__[internal_item.key] = key
-                        break
-                else:
-                    raise UnknownUnionKey(f"Unknown key found `{key}`")
+            return validate_external
 
-            case "adjacent":
-                if not isinstance(value, dict):
-                    raise generate_invalid_type(model, item, root_item, root_value)
+        case "adjacent":
+            tag_key = item.tag_info["tag"]
+            content_key = item.tag_info["content"]
 
-                tag_key = item.tag_info["tag"]
-                content_key = item.tag_info["content"]
+            def validate_adjacent(model: Model, value: Any) -> Any:
+                if not isinstance(value, dict):
+                    return resolve_instance(model, value)
 
                 try:
                     key = value[tag_key]
                     content = value[content_key]
                 except KeyError:
-                    raise generate_invalid_type(model, item, root_item, root_value)
+                    raise InvalidType(model.__class__, item, value)
 
-                for internal_item in item.ty:
-                    assert isinstance(internal_item, InternalItem)
-                    assert internal_item.type_name
+                return resolve(model, key, content, content_key)
 
-                    if key == internal_item.type_name:
-                        value = validate(internal_item, model, content, root_item, root_value)
-                        model.__tag_map__[internal_item.key] = key
-                        break
-                else:
-                    raise UnknownUnionKey(f"Unknown key found `{key}`")
+            return validate_adjacent
 
-            case "internal":
-                if not isinstance(value, dict):
-                    raise generate_invalid_type(model, item, root_item, root_value)
+        case "internal":
+            tag_key = item.tag_info["tag"]
+            strict = _strict_variants(item)
 
-                tag_key = item.tag_info["tag"]
+            def validate_internal(model: Model, value: Any) -> Any:
+                if not isinstance(value, dict):
+                    return resolve_instance(model, value)
 
                 try:
                     key = value[tag_key]
                 except KeyError:
-                    raise MissingRequiredKey(f"Missing required key {model.__class__.__name__}.{tag_key}")
+                    raise MissingRequiredKey(model.__class__, tag_key)
+
+                if strict and isinstance(key, str) and key in strict:
+                    value = {inner_key: inner_value for inner_key, inner_value in value.items() if inner_key != tag_key}
+
+                return resolve(model, key, value, None)
+
+            return validate_internal
+
+        case _:
+            raise ValueError(f"Unknown tag type {item.tag}")
+
+AsyncValidator: TypeAlias = Callable[["Model", Any, asyncio.Semaphore], Coroutine[Any, Any, Any]]
+
+def is_async(item: InternalItem[Any]) -> bool:
+    if iscoroutinefunction(item.validate) or iscoroutinefunction(item.hook):
+        return True
+
+    if isinstance(item.ty, list):
+        return any(is_async(variant) for variant in item.ty)
+
+    if is_model(item.ty):
+        return item.ty._is_async
+
+    return any(is_async(internal_item) for internal_item in item.internal_items)
+
+async def _gather(awaitables: list[Awaitable[Any]]) -> list[Any]:
+    if len(awaitables) == 1:
+        return [await awaitables[0]]
+
+    tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        # the first failure is reported, theres no point finishing the rest
+        for task in tasks:
+            task.cancel()
+
+        raise
+
+async def _located(awaitable: Awaitable[Any], segment: Any) -> Any:
+    try:
+        return await awaitable
+    except PathError as e:
+        e._at(segment)
+        raise
+
+async def _in_field(awaitable: Awaitable[Any], model: type[Model], key: str) -> Any:
+    try:
+        return await awaitable
+    except PathError as e:
+        e._in(model, key)
+        raise
 
-                for internal_item in item.ty:
-                    assert isinstance(internal_item, InternalItem)
-                    assert internal_item.type_name
+def _async_item_validator(item: InternalItem[Any]) -> AsyncValidator:
+    if is_async(item):
+        return compile_async_validator(item)
 
-                    if key == internal_item.type_name:
-                        value = validate(internal_item, model, value, root_item, root_value)
-                        model.__tag_map__[internal_item.key] = key
-                        break
-                else:
-                    raise UnknownUnionKey(f"Unknown key found `{key}`")
+    validator = _item_validator(item, None)
 
+    async def validate_sync(model: Model, value: Any, semaphore: asyncio.Semaphore) -> Any:
+        return validator(model, value)
+
+    return validate_sync
+
+def compile_async_validator(item: InternalItem[Any]) -> AsyncValidator:
+    # only used for items where an async validator or hook is somewhere inside, the sync validators
+    # are used for everything else. the semaphore limits how many async callables run at once
+    ty = item.ty
+
+    if is_model(ty):
+        transparent = issubclass(ty, TransparentModel)
+
+        async def validate_model(model: Model, value: Any, semaphore: asyncio.Semaphore) -> Any:
+            if isinstance(value, ty):
+                return value
+
+            if not transparent and not isinstance(value, dict):
+                raise InvalidType(model.__class__, item, value)
+
+            return await ty._avalidate(value, semaphore)
+
+        return validate_model
+
+    if isinstance(ty, list):
+        check = _compile_async_union(item)
     else:
-        if not isinstance(value, origin):
-            raise generate_invalid_type(model, item, root_item, root_value)
+        check = _compile_async_type(item)
+
+    item_validate = item.validate
+    item_hook = item.hook
+
+    async def validate_item(model: Model, value: Any, semaphore: asyncio.Semaphore) -> Any:
+        value = await check(model, value, semaphore)
+        valid = item_validate(value)
+
+        if isawaitable(valid):
+            async with semaphore:
+                valid = await valid
+
+        if not valid:
+            raise FailedValidation(model.__class__, item, value)
+
+        value = item_hook(value)
+
+        if isawaitable(value):
+            async with semaphore:
+                value = await value
+
+        return value
+
+    return validate_item
+
+def _compile_async_type(item: InternalItem[Any]) -> AsyncValidator:
+    origin = get_origin(item.ty)
+
+    if not any(is_async(internal_item) for internal_item in item.internal_items):
+        validator = _compile_type(item)
+
+        async def validate_sync(model: Model, value: Any, semaphore: asyncio.Semaphore) -> Any:
+            return validator(model, value)
+
+        return validate_sync
+
+    if origin in (list, set, tuple):
+        validate_element = _async_item_validator(item.internal_items[0])
+        indexed = origin is not set
+
+        async def validate_sequence(model: Model, value: Any, semaphore: asyncio.Semaphore) -> Any:
+            if not isinstance(value, origin):
+                raise InvalidType(model.__class__, item, value)
+
+            if indexed:
+                output = await _gather([_located(validate_element(model, internal_value, semaphore), i) for i, internal_value in enumerate(value)])
+            else:
+                output = await _gather([validate_element(model, internal_value, semaphore) for internal_value in value])
+
+            return output if origin is list else origin(output)
+
+        return validate_sequence
+
+    key_item, value_item = item.internal_items
+    validate_key = _async_item_validator(key_item)
+    validate_value = _async_item_validator(value_item)
+
+    async def validate_mapping(model: Model, value: Any, semaphore: asyncio.Semaphore) -> Any:
+        if not isinstance(value, dict):
+            raise InvalidType(model.__class__, item, value)
+
+        keys = await _gather([validate_key(model, internal_key, semaphore) for internal_key in value])
+        values = await _gather([_located(validate_value(model, internal_value, semaphore), internal_key) for internal_key, internal_value in value.items()])
+
+        return dict(zip(keys, values))
+
+    return validate_mapping
+
+def _compile_async_union(item: InternalItem[Any]) -> AsyncValidator:
+    variants: list[InternalItem[Any]] = item.ty  # type: ignore
+
+    if item.tag == "untagged":
+        discriminate = _compile_discriminator(variants, [_async_item_validator(variant) for variant in variants])
+
+        async def validate_untagged(model: Model, value: Any, semaphore: asyncio.Semaphore) -> Any:
+            for validator in discriminate(value):
+                try:
+                    return await validator(model, value, semaphore)
+                except SpecError:
+                    pass
+
+            raise InvalidType(model.__class__, item, value)
+
+        return validate_untagged
+
+    tagged = {type_name: (variant.key, _async_item_validator(variant)) for type_name, variant in item.variants.items()}
+    tag_key = item.tag_info.get("tag")
+    strict = _strict_variants(item)
+    content_key = item.tag_info.get("content")
+
+    instances = _instance_tags(item)
+
+    async def validate_tagged(model: Model, value: Any, semaphore: asyncio.Semaphore) -> Any:
+        if not isinstance(value, dict):
+            if (key := instances.get(value.__class__)) is None:
+                raise InvalidType(model.__class__, item, value)
+
+            content = value
+            segment = None
+
+        elif item.tag == "external":
+            try:
+                key, content = next(iter(value.items()))
+            except StopIteration:
+                raise UnknownUnionKey(f"Unknown key found ``")
 
-    if origin in [list, set, tuple]:
-        internal_item = item.internal_items[0]
+            segment = key
 
-        list_output: list[InternalItem] = []
+        elif item.tag == "adjacent":
+            try:
+                key = value[tag_key]
+                content = value[content_key]
+            except KeyError:
+                raise InvalidType(model.__class__, item, value)
 
-        for internal_value in value:
-            list_output.append(validate(internal_item, model, internal_value, root_item, root_value))
+            segment = content_key
 
-        value = origin(list_output)
+        else:
+            try:
+                key = value[tag_key]
+            except KeyError:
+                raise MissingRequiredKey(model.__class__, tag_key)
+
+            content = {inner_key: inner_value for inner_key, inner_value in value.items() if inner_key != tag_key} if strict and isinstance(key, str) and key in strict else value
+            segment = None
+
+        try:
+            field, validator = tagged[key]
+        except (KeyError, TypeError):
+            raise UnknownUnionKey(f"Unknown key found `{key}`") from None
+
+        try:
+            content = await validator(model, content, semaphore)
+        except PathError as e:
+            if segment is not None:
+                e._field(segment)
+
+            raise
+
+        model.__tag_map__[field] = key
+
+        return content
+
+    return validate_tagged
+
+Builder: TypeAlias = Callable[["Model", Any], Any]
+
+def compile_builder(item: InternalItem[Any]) -> Builder | None:
+    # used by `Model.construct`, only goes as deep as needed to build nested models and fill in
+    # the tag map, returns None when the value can be used as is
+    ty = item.ty
+
+    if is_model(ty):
+        def build_model(model: Model, value: Any) -> Any:
+            if isinstance(value, ty):
+                return value
+
+            return ty.construct(value)
+
+        return build_model
+
+    if isinstance(ty, list):
+        return _compile_union_builder(item)
+
+    origin = get_origin(ty)
+
+    if origin in (list, set, tuple) and item.internal_items:
+        if (build_element := compile_builder(item.internal_items[0])) is None:
+            return None
+
+        def build_sequence(model: Model, value: Any) -> Any:
+            return origin([build_element(model, internal_value) for internal_value in value])
+
+        return build_sequence
+
+    if origin is dict and item.internal_items:
+        if (build_value := compile_builder(item.internal_items[1])) is None:
+            return None
+
+        def build_mapping(model: Model, value: Any) -> Any:
+            return {internal_key: build_value(model, internal_value) for internal_key, internal_value in value.items()}
+
+        return build_mapping
+
+    return None
+
+def _compile_union_builder(item: InternalItem[Any]) -> Builder | None:
+    variants: list[InternalItem[Any]] = item.ty  # type: ignore
+
+    if item.tag == "untagged":
+        builders = [compile_builder(variant) for variant in variants]
+
+        if not any(builders):
+            return None
+
+        discriminate = _compile_discriminator(variants, builders)
+
+        def build_untagged(model: Model, value: Any) -> Any:
+            if (found := discriminate(value)) and (builder := found[0]) is not None:
+                return builder(model, value)
+
+            return value
+
+        return build_untagged
+
+    tagged = {type_name: (variant.key, compile_builder(variant)) for type_name, variant in item.variants.items()}
+    instances = _instance_tags(item)
+
+    def resolve(model: Model, key: Any, value: Any) -> Any:
+        try:
+            field, builder = tagged[key]
+        except (KeyError, TypeError):
+            raise UnknownUnionKey(f"Unknown key found `{key}`") from None
+
+        model.__tag_map__[field] = key
+
+        return value if builder is None else builder(model, value)
+
+    match item.tag:
+        case "external":
+            def build_external(model: Model, value: Any) -> Any:
+                if type(value) in instances:
+                    return resolve(model, instances[type(value)], value)
+
+                key, content = next(iter(value.items()))
+
+                return resolve(model, key, content)
+
+            return build_external
+
+        case "adjacent":
+            tag_key = item.tag_info["tag"]
+            content_key = item.tag_info["content"]
+
+            def build_adjacent(model: Model, value: Any) -> Any:
+                if type(value) in instances:
+                    return resolve(model, instances[type(value)], value)
+
+                return resolve(model, value[tag_key], value[content_key])
+
+            return build_adjacent
+
+        case "internal":
+            tag_key = item.tag_info["tag"]
+
+            def build_internal(model: Model, value: Any) -> Any:
+                if type(value) in instances:
+                    return resolve(model, instances[type(value)], value)
+
+                return resolve(model, value[tag_key], value)
 
-    elif origin is dict:
-        internal_item_key, internal_item_value = item.internal_items
+            return build_internal
 
-        dict_output: dict[Any, Any] = {}
+        case _:
+            raise ValueError(f"Unknown tag type {item.tag}")
+
+def convert_to_item(cls: type, key: str, annotation: Any, existing: Item | None = None) -> Item:
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+
+    if origin is Annotated:
+        item = convert_to_item(cls, key, args[0], args[1])
+    elif existing:
+        # the item from `Annotated` can be shared by many annotations so it is copied rather than filled in
+        item = replace(existing, _key=key, _ty=annotation, _modified=[*existing._modified])
+    else:
+        item = Item(_key=key, _ty=annotation)
+
+    if is_union(origin):
+        if any(x is NoneType for x in args) and "_default" not in item._modified:  # for handling Optional
+            item._default = lambda: None
+
+        internal_types = []
+        variants: dict[str, InternalItem] = {}
+
+        for ty in args:
+            internal_item = schema_item(cls, key, ty)
+
+            if item._tag != "untagged" and not internal_item.type_name:
+                if not is_model(ty):
+                    raise MissingTypeName(f"{cls.__name__}.{key} union type is missing a type name for {ty}")
+
+                internal_item = replace(internal_item, type_name=ty._type_name, validator=None)
+
+            if internal_item.type_name:
+                variants.setdefault(internal_item.type_name, internal_item)
+
+            internal_types.append(internal_item)
+
+        item._ty = internal_types
+        item._variants = variants
+
+    if existing:
+        for modified in existing._modified:
+            setattr(item, modified, getattr(existing, modified))
+
+    # the arguments of `Annotated` are the inner type and its metadata, the inner type has already filled these in
+    if origin is not Annotated:
+        item._internal_items = [schema_item(cls, key, ty) for ty in get_args(annotation)]
+
+    return item
+
+# items are shared by every model which uses the same key and annotation, so they must not be changed
+# once cached. models which need a different rename or default make a copy with `replace`
+_item_cache: dict[tuple[str, Any], InternalItem[Any]] = {}
+
+def _annotation_key(annotation: Any) -> Any:
+    # `A | B == B | A`, but untagged unions try their variants in order, so the arguments are part of the key
+    if not (args := get_args(annotation)):
+        return annotation
+
+    return (annotation, tuple([_annotation_key(arg) for arg in args]))
+
+def schema_item(cls: type, key: str, annotation: Any) -> InternalItem[Any]:
+    cache_key = (key, _annotation_key(annotation))
+
+    try:
+        item = _item_cache.get(cache_key)
+    except TypeError:
+        # annotations with unhashable metadata arent cached
+        return convert_to_item(cls, key, annotation)._to_internal()
+
+    if item is None:
+        item = _item_cache[cache_key] = convert_to_item(cls, key, annotation)._to_internal()
+
+    return item
+
+def _copy_item(item: InternalItem[Any], **changes: Any) -> InternalItem[Any]:
+    # `dataclasses.replace` without the per call field introspection, every field of every model is copied
+    copy = object.__new__(InternalItem)
+    copy.__dict__.update(item.__dict__, **changes)
+
+    return copy
+
+def clear_schema_cache() -> None:
+    _item_cache.clear()
+    _transparent_cache.clear()
+
+def value_to_dict(value: Any, tag_map: Mapping[str, Any], item: InternalItem) -> Any:
+    output = value
+
+    if isinstance(value, Model):
+        output = value.to_dict()
+
+    if isinstance(value, (list, set, tuple)):
+        list_inner_output: list[Any] = []
+
+        for inner_value in value:
+            if isinstance(inner_value, Model):
+                inner_value = inner_value.to_dict()
+
+            list_inner_output.append(inner_value)
+
+        output: Any = UNTRACKED.get(value.__class__, value.__class__)(list_inner_output)
+
+    if isinstance(value, dict):
+        dict_inner_output: dict[Any, Any] = {}
+
+        for inner_key, inner_value in value.items():
+            if isinstance(inner_value, Model):
+                inner_value = inner_value.to_dict()
+
+            dict_inner_output[inner_key] = inner_value
+
+        output = dict_inner_output
+
+    if item.tag == "external":
+        output = {tag_map[item.key]: output}
+
+    elif item.tag == "internal":
+        # copied as cached models hand out the same dict every time
+        output = {**output, item.tag_info["tag"]: tag_map[item.key]}
+
+    elif item.tag == "adjacent":
+        output = {
+            item.tag_info["tag"]: tag_map[item.key],
+            item.tag_info["content"]: output
+        }
+
+    return output
+
+Serializer: TypeAlias = Callable[[Any, Mapping[str, Any]], Any]
+
+def compile_serializer(item: InternalItem[Any], tagged: bool = True) -> Serializer | None:
+    # mirrors `compile_validator`, returns None when the value can be used as is. the tag map only
+    # holds one tag per field, so elements of containers are written without their tags like `to_json`
+    ty = item.ty
+
+    if is_model(ty):
+        serialize = _serialize_model
+    elif isinstance(ty, list):
+        # containers are copied so the output never shares them with the model
+        serialize = None if all(is_plain(variant) and get_origin(variant.ty) not in (list, set, tuple, dict) for variant in ty) else _serialize_dynamic
+    else:
+        serialize = _compile_container_serializer(item)
+
+    if item.tag == "untagged" or not tagged:
+        return serialize
+
+    return _compile_tag_serializer(item, serialize)
+
+def _serialize_model(value: Model, tag_map: Mapping[str, Any]) -> Any:
+    return value.to_dict()
+
+def _serialize_dynamic(value: Any, tag_map: Mapping[str, Any]) -> Any:
+    # used for untagged union variants, where only the value knows which variant it is
+    if isinstance(value, Model):
+        return value.to_dict()
+
+    if isinstance(value, (list, set, tuple)):
+        return UNTRACKED.get(value.__class__, value.__class__)([_serialize_dynamic(inner_value, tag_map) for inner_value in value])
+
+    if isinstance(value, dict):
+        return {inner_key: _serialize_dynamic(inner_value, tag_map) for inner_key, inner_value in value.items()}
+
+    return value
+
+def _compile_container_serializer(item: InternalItem[Any]) -> Serializer | None:
+    origin = get_origin(item.ty)
+
+    if origin in (list, set, tuple):
+        if not item.internal_items or (serialize_element := compile_serializer(item.internal_items[0], tagged=False)) is None:
+            def copy_sequence(value: Any, tag_map: Mapping[str, Any]) -> Any:
+                return origin(value)
+
+            return copy_sequence
+
+        if origin is list:
+            def serialize_list(value: Any, tag_map: Mapping[str, Any]) -> Any:
+                return [serialize_element(inner_value, tag_map) for inner_value in value]
+
+            return serialize_list
+
+        def serialize_sequence(value: Any, tag_map: Mapping[str, Any]) -> Any:
+            return origin([serialize_element(inner_value, tag_map) for inner_value in value])
+
+        return serialize_sequence
+
+    if origin is dict:
+        if not item.internal_items or (serialize_value := compile_serializer(item.internal_items[1], tagged=False)) is None:
+            def copy_mapping(value: Any, tag_map: Mapping[str, Any]) -> Any:
+                return dict(value)
+
+            return copy_mapping
+
+        def serialize_mapping(value: Any, tag_map: Mapping[str, Any]) -> Any:
+            return {inner_key: serialize_value(inner_value, tag_map) for inner_key, inner_value in value.items()}
+
+        return serialize_mapping
+
+    return None
+
+def _compile_tag_serializer(item: InternalItem[Any], serialize: Serializer | None) -> Serializer:
+    key = item.key
+    tag_key = item.tag_info.get("tag")
+    content_key = item.tag_info.get("content")
+    serialize = serialize or _serialize_dynamic
+
+    match item.tag:
+        case "external":
+            def serialize_external(value: Any, tag_map: Mapping[str, Any]) -> Any:
+                return {tag_map[key]: serialize(value, tag_map)}
+
+            return serialize_external
+
+        case "internal":
+            if _caches_output(item):
+                # cached models hand out the same dict every time, so the tag is added to a copy
+                def serialize_cached_internal(value: Any, tag_map: Mapping[str, Any]) -> Any:
+                    return {**serialize(value, tag_map), tag_key: tag_map[key]}
+
+                return serialize_cached_internal
+
+            def serialize_internal(value: Any, tag_map: Mapping[str, Any]) -> Any:
+                output = serialize(value, tag_map)
+                output[tag_key] = tag_map[key]
+
+                return output
+
+            return serialize_internal
+
+        case "adjacent":
+            def serialize_adjacent(value: Any, tag_map: Mapping[str, Any]) -> Any:
+                return {tag_key: tag_map[key], content_key: serialize(value, tag_map)}
+
+            return serialize_adjacent
+
+        case _:
+            raise ValueError(f"Unknown tag type {item.tag}")
+
+def _caches_output(item: InternalItem[Any]) -> bool:
+    variants = item.ty if isinstance(item.ty, list) else [item]
+
+    return any(is_model(variant.ty) and variant.ty._cache for variant in variants)
+
+def _encode_default(value: Any) -> Any:
+    if isinstance(value, set):
+        return list(value)
+
+    raise TypeError(f"Object of type {value.__class__.__name__} is not JSON serializable")
+
+def is_plain(item: InternalItem[Any]) -> bool:
+    if is_model(item.ty) or item.tag != "untagged":
+        return False
+
+    if isinstance(item.ty, list) and not all(is_plain(variant) for variant in item.ty):
+        return False
+
+    return all(is_plain(internal_item) for internal_item in item.internal_items)
+
+class JSONWriter:
+    # writes models as json text piece by piece, following the same layout as `value_to_dict`
+    # without building the intermediate dicts
+
+    def __init__(self, write: Callable[[str], Any], *, ensure_ascii: bool = True, separators: tuple[str, str] = (", ", ": ")):
+        self.write = write
+        self.options = (ensure_ascii, tuple(separators))
+        self.encode_string = encode_basestring_ascii if ensure_ascii else encode_basestring
+        self.item_separator, self.key_separator = separators
+
+        # values without any models in them are handed to the json encoder in one go
+        if c_make_encoder is not None:
+            encoder = c_make_encoder(None, _encode_default, self.encode_string, None, self.key_separator, self.item_separator, False, False, True)
+            self.encode: Callable[[Any], str] = lambda value: "".join(encoder(value, 0))
+        else:
+            self.encode = JSONEncoder(ensure_ascii=ensure_ascii, separators=separators, default=_encode_default).encode
 
-        for internal_key, internal_value in value.items():
-            internal_key = validate(internal_item_key, model, internal_key, root_item, root_value)
-            internal_value = validate(internal_item_value, model, internal_value, root_item, root_value)
+    def key(self, key: Any) -> str:
+        if isinstance(key, str):
+            return self.encode_string(key)
 
-            dict_output[internal_key] = internal_value
+        if isinstance(key, (int, float, NoneType)):
+            return f"\"{self.encode(key)}\""
 
-        value = dict_output
+        raise TypeError(f"keys must be str, int, float, bool or None, not {key.__class__.__name__}")
 
-    if not item.validate(value):
-        raise FailedValidation(f"{model.__class__.__name__}.{item.key} failed validation")
+    def value(self, value: Any) -> None:
+        write = self.write
 
-    return item.hook(value)
+        if isinstance(value, str):
+            write(self.encode_string(value))
 
-def convert_to_item(cls: type, key: str, annotation: Any, existing: Item | None = None) -> Item:
-    origin = get_origin(annotation)
-    args = get_args(annotation)
+        elif isinstance(value, Model):
+            value._write_json(self)
 
-    if origin is Annotated:
-        item = convert_to_item(cls, key, args[0], args[1])
-    else:
-        if existing:
-            existing._key = key
-            existing._ty = annotation
+        elif isinstance(value, (list, set, tuple)):
+            write("[")
 
-            item = existing
-        else:
-            item = Item(_key=key, _ty=annotation)
+            for i, inner_value in enumerate(value):
+                if i:
+                    write(self.item_separator)
 
-    if is_union(origin):
-        if any(x is NoneType for x in args) and "_default" not in item._modified:  # for handling Optional
-            item._default = lambda: None
+                self.value(inner_value)
 
-        internal_types = []
+            write("]")
 
-        for ty in args:
-            inner_item = convert_to_item(cls, key, ty)
+        elif isinstance(value, dict):
+            write("{")
 
-            if item._tag != "untagged":
-                if is_model(ty) and not inner_item._type_name:
-                    inner_item._type_name = ty._type_name
+            for i, (inner_key, inner_value) in enumerate(value.items()):
+                if i:
+                    write(self.item_separator)
 
-                if not inner_item._type_name:
-                    raise MissingTypeName(f"{cls.__name__}.{key} union type is missing a type name for {ty}")
+                write(self.key(inner_key))
+                write(self.key_separator)
+                self.value(inner_value)
 
-            internal_types.append(inner_item._to_internal())
+            write("}")
 
-        item._ty = internal_types
+        else:
+            write(self.encode(value))
 
-    if existing:
-        for modified in existing._modified:
-            setattr(item, modified, getattr(existing, modified))
+    def item(self, value: Any, tag_map: Mapping[str, Any], item: InternalItem) -> None:
+        write = self.write
 
-    internal_items: list[InternalItem] = []
+        match item.tag:
+            case "external":
+                write("{")
+                write(self.key(tag_map[item.key]))
+                write(self.key_separator)
+                self.value(value)
+                write("}")
 
-    for ty in get_args(annotation):
-        internal_items.append(convert_to_item(cls, key, ty)._to_internal())
+            case "internal":
+                assert isinstance(value, Model)
 
-    item._internal_items = internal_items
+                value._write_json(self, (item.tag_info["tag"], tag_map[item.key]))
 
-    return item
+            case "adjacent":
+                write("{")
+                write(self.key(item.tag_info["tag"]))
+                write(self.key_separator)
+                self.value(tag_map[item.key])
+                write(self.item_separator)
+                write(self.key(item.tag_info["content"]))
+                write(self.key_separator)
+                self.value(value)
+                write("}")
 
-def value_to_dict(value: Any, tag_map: dict[str, Any], item: InternalItem) -> Any:
-    output = value
+            case _:
+                self.value(value)
 
-    if isinstance(value, Model):
-        output = value.to_dict()
+def dump_json(models: Iterable[Model], fp: IO[str] | IO[bytes] | None = None, *, ensure_ascii: bool = True, separators: tuple[str, str] = (", ", ": ")) -> str | None:
+    parts: list[str] = []
+    writer = JSONWriter(parts.append, ensure_ascii=ensure_ascii, separators=separators)
 
-    if isinstance(value, (list, set, tuple)):
-        list_inner_output: list[Any] = []
+    if fp is None:
+        parts.append("[")
 
-        for inner_value in value:
-            if isinstance(inner_value, Model):
-                inner_value = inner_value.to_dict()
+        for i, model in enumerate(models):
+            if i:
+                parts.append(writer.item_separator)
 
-            list_inner_output.append(inner_value)
+            model._write_json(writer)
 
-        output: Any = type(value)(list_inner_output)
+        parts.append("]")
 
-    if isinstance(value, dict):
-        dict_inner_output: dict[Any, Any] = {}
+        return "".join(parts)
 
-        for inner_key, inner_value in value.items():
-            if isinstance(inner_value, Model):
-                inner_value = inner_value.to_dict()
+    # each model is flushed to the file once written so only one of them is held in memory
+    binary = isinstance(fp, (io.RawIOBase, io.BufferedIOBase)) or "b" in getattr(fp, "mode", "")
 
-            dict_inner_output[inner_key] = inner_value
+    def flush() -> None:
+        text = "".join(parts)
+        parts.clear()
 
-        output = dict_inner_output
+        fp.write(text.encode() if binary else text)  # type: ignore
 
-    if item.tag == "external":
-        output = {tag_map[item.key]: output}
+    parts.append("[")
 
-    elif item.tag == "internal":
-        output[item.tag_info["tag"]] = tag_map[item.key]
+    for i, model in enumerate(models):
+        if i:
+            parts.append(writer.item_separator)
 
-    elif item.tag == "adjacent":
-        output = {
-            item.tag_info["tag"]: tag_map[item.key],
-            item.tag_info["content"]: output
-        }
+        model._write_json(writer)
+        flush()
 
-    return output
+    parts.append("]")
+    flush()
 
 class RenameBase:
     @staticmethod
@@ -281,67 +1184,826 @@ class ScreamingKebabCase(RenameBase):
 
 RenameScheme: TypeAlias = Default | Upper | CamelCase | PascalCase | KebabCase | ScreamingKebabCase
 
-class Model:
+def is_tagged(item: InternalItem[Any]) -> bool:
+    if item.tag != "untagged":
+        return True
+
+    if is_model(item.ty):
+        return False
+
+    if isinstance(item.ty, list) and any(is_tagged(variant) for variant in item.ty):
+        return True
+
+    return any(is_tagged(internal_item) for internal_item in item.internal_items)
+
+class _NoTags(Mapping[str, Any]):
+    # the tag map of models without tagged unions, pickled by reference so copies share it too
+    __slots__ = ()
+
+    def __getitem__(self, key: str) -> Any:
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(())
+
+    def __len__(self) -> int:
+        return 0
+
+    def __repr__(self) -> str:
+        return "NO_TAGS"
+
+    def __reduce__(self) -> str:
+        return "NO_TAGS"
+
+NO_TAGS: Mapping[str, Any] = _NoTags()
+
+def _no_values(model: Model) -> tuple[()]:
+    return ()
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        return tuple([_freeze(inner_value) for inner_value in value])
+
+    if isinstance(value, (set, frozenset)):
+        return frozenset([_freeze(inner_value) for inner_value in value])
+
+    if isinstance(value, dict):
+        return frozenset([(inner_key, _freeze(inner_value)) for inner_key, inner_value in value.items()])
+
+    return value
+
+def _frozen_setattr(self: Model, name: str, value: Any) -> None:
+    raise FrozenInstance(f"Cannot assign to field {self.__class__.__name__}.{name} of a frozen model")
+
+def _frozen_delattr(self: Model, name: str) -> None:
+    raise FrozenInstance(f"Cannot delete field {self.__class__.__name__}.{name} of a frozen model")
+
+def _validated_setattr(self: Model, name: str, value: Any) -> None:
+    if (entry := self._assignments.get(name)) is not None:
+        key, validator = entry
+
+        try:
+            value = validator(self, value)
+        except PathError as e:
+            e._in(self.__class__, key)
+            raise
+
+    object.__setattr__(self, name, value)
+
+_IMMUTABLE = frozenset((int, float, str, bool, bytes, NoneType))
+
+def _adopt(value: Any, owner: Model) -> Any:
+    # returns `value` with its containers swapped for tracked ones owned by `owner` and its cached
+    # models linked to `owner`, so changing any of them drops the cached output of `owner`. a container
+    # only has one owner, so ones already tracked by another model are copied
+    cls = value.__class__
+
+    if cls in _IMMUTABLE:
+        return value
+
+    if cls is list or cls is TrackedList:
+        if cls is list or getattr(value, "owner", None) is not owner:
+            value = TrackedList(value)
+
+        value.owner = owner
+
+        for i, inner_value in enumerate(value):
+            if (adopted := _adopt(inner_value, owner)) is not inner_value:
+                list.__setitem__(value, i, adopted)
+
+        return value
+
+    if cls is dict or cls is TrackedDict:
+        if cls is dict or getattr(value, "owner", None) is not owner:
+            value = TrackedDict(value)
+
+        value.owner = owner
+
+        for inner_key, inner_value in value.items():
+            if (adopted := _adopt(inner_value, owner)) is not inner_value:
+                dict.__setitem__(value, inner_key, adopted)
+
+        return value
+
+    if cls is set or cls is TrackedSet:
+        if cls is set or getattr(value, "owner", None) is not owner:
+            value = TrackedSet(value)
+
+        value.owner = owner
+
+        return value
+
+    if cls is tuple:
+        adopted = tuple([_adopt(inner_value, owner) for inner_value in value])
+
+        return value if all(map(is_, adopted, value)) else adopted
+
+    if isinstance(value, TransparentModel):
+        if (adopted := _adopt(value.value, owner)) is not value.value:
+            object.__setattr__(value, "value", adopted)
+
+        return value
+
+    if isinstance(value, Model):
+        if value._cache:
+            value._output_cache()
+            link(value, owner)
+
+        elif not value._frozen:
+            raise TypeError(f"{owner.__class__.__name__} caches its output, so {value.__class__.__name__} needs cache=True or frozen=True")
+
+    return value
+
+def _cached_setattr(self: Model, name: str, value: Any) -> None:
+    if self._validate_assignment:
+        _validated_setattr(self, name, value)
+    else:
+        object.__setattr__(self, name, value)
+
+    invalidate(self)
+
+def _cached_delattr(self: Model, name: str) -> None:
+    object.__delattr__(self, name)
+    invalidate(self)
+
+def _cached_getstate(self: Model) -> Any:
+    # the cached output and the links to the models holding this one aren't kept
+    state = object.__getstate__(self)
+
+    if isinstance(state, tuple):
+        return tuple(mapping and {key: value for key, value in mapping.items() if key not in _CACHE_STATE} for mapping in state)
+
+    return {key: value for key, value in state.items() if key not in _CACHE_STATE}
+
+_CACHE_STATE = frozenset(("__spec_cache__", "__spec_owners__"))
+
+def _cached_to_dict(self: Model) -> dict[str, Any]:
+    cache = self._output_cache()
+
+    if (output := cache.get(None)) is None:
+        output = cache[None] = Model.to_dict(self)
+
+    return output
+
+def _cached_to_json(self: Model, *, ensure_ascii: bool = True, separators: tuple[str, str] = (", ", ": ")) -> str:
+    if (text := self._output_cache().get((ensure_ascii, tuple(separators)))) is None:
+        # filled in by `_cached_write_json`
+        text = Model.to_json(self, ensure_ascii=ensure_ascii, separators=separators)
+
+    return text
+
+def _cached_write_json(self: Model, writer: JSONWriter, extra: tuple[Any, Any] | None = None) -> None:
+    cache = self._output_cache()
+
+    # internally tagged variants have their tag written inside them, so they are cached separately
+    key = writer.options if extra is None else (writer.options, extra)
+
+    if (text := cache.get(key)) is None:
+        # the writer's methods read `write` when they start, so swapping it captures just this model
+        write = writer.write
+        parts: list[str] = []
+        writer.write = parts.append
+
+        try:
+            Model._write_json(self, writer, extra)
+        finally:
+            writer.write = write
+
+        text = cache[key] = "".join(parts)
+
+    writer.write(text)
+
+def _frozen_setstate(self: Model, state: Any) -> None:
+    # used by pickle, the cached hash is dropped as string hashes differ between processes
+    for mapping in state if isinstance(state, tuple) else (state,):
+        for key, value in (mapping or {}).items():
+            if key != "__spec_hash__":
+                object.__setattr__(self, key, value)
+
+def _frozen_hash(self: Model) -> int:
+    try:
+        return self.__spec_hash__  # type: ignore
+    except AttributeError:
+        pass
+
+    # containers are hashed by their contents, the result is kept as the fields cant change
+    value = hash((self.__class__, _freeze(self._values(self))))
+    object.__setattr__(self, "__spec_hash__", value)
+
+    return value
+
+class _Pending:
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+def _defer(model: Model, value: Any) -> _Pending:
+    return _Pending(value)
+
+class TagMapSlot:
+    # replaces the `__tag_map__` slot of slotted models without tagged unions, which is never filled
+    def __init__(self, storage: Any):
+        self.storage = storage
+
+    def __get__(self, instance: Model | None, owner: type[Model]) -> Any:
+        if instance is None:
+            return self
+
+        try:
+            return self.storage.__get__(instance, owner)
+        except AttributeError:
+            return NO_TAGS
+
+    def __set__(self, instance: Model, value: Any) -> None:
+        self.storage.__set__(instance, value)
+
+    def __delete__(self, instance: Model) -> None:
+        self.storage.__delete__(instance)
+
+class LazyField:
+    # stores the raw value of a field in lazy models and validates it the first time it is read,
+    # `storage` is the slot descriptor the field replaced when the model uses slots
+    def __init__(self, name: str, validator: Validator, storage: Any = None, key: str | None = None):
+        self.name = name
+        self.validator = validator
+        self.storage = storage
+        self.key = key or name
+
+    def __get__(self, instance: Model | None, owner: type[Model]) -> Any:
+        if instance is None:
+            return self
+
+        if self.storage is not None:
+            value = self.storage.__get__(instance, owner)
+        else:
+            try:
+                value = instance.__dict__[self.name]
+            except KeyError:
+                raise AttributeError(f"'{owner.__name__}' object has no attribute '{self.name}'") from None
+
+        if value.__class__ is _Pending:
+            try:
+                value = self.validator(instance, value.value)
+            except PathError as e:
+                e._in(instance.__class__, self.key)
+                raise
+
+            self.__set__(instance, value)
+
+        return value
+
+    def __set__(self, instance: Model, value: Any) -> None:
+        if self.storage is not None:
+            self.storage.__set__(instance, value)
+        else:
+            instance.__dict__[self.name] = value
+
+    def __delete__(self, instance: Model) -> None:
+        if self.storage is not None:
+            self.storage.__delete__(instance)
+        else:
+            try:
+                del instance.__dict__[self.name]
+            except KeyError:
+                raise AttributeError(self.name) from None
+
+class _OnDemand:
+    # a class attribute computed from the model the first time it is read, the result then replaces it
+    # on that class so later reads are plain attribute lookups
+    def __init__(self, build: Callable[[Any], Any]):
+        self.build = build
+        self.name = build.__name__
+
+    def __get__(self, instance: Model | None, owner: type[Model]) -> Any:
+        value = self.build(owner)
+        setattr(owner, self.name, value)
+
+        return value
+
+class _DeferredSchema:
+    # stands in for every compiled attribute of a model defined with `defer=True` until one is read
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance: Model | None, owner: type[Model]) -> Any:
+        owner._build()
+
+        return getattr(owner, self.name)
+
+_ON_DEMAND_ATTRIBUTES = ("_plain", "_serializers", "_builders", "_is_async", "_async_plan", "_assignments")
+_SCHEMA_ATTRIBUTES = ("_items", "_validators", "_plan", "_required", "_defaults", "_tagged", "_values", *_ON_DEMAND_ATTRIBUTES)
+
+class ModelMeta(type):
+    def __new__(mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any], /, **kwargs: Any) -> ModelMeta:
+        if kwargs.get("slots"):
+            annotations: dict[str, Any] = namespace.get("__annotations__", {})
+
+            # class attribute defaults would clash with the slots so they are moved aside
+            namespace["__spec_defaults__"] = {key: namespace.pop(key) for key in annotations if key in namespace}
+            slots = [*annotations, "__tag_map__"]
+
+            if kwargs.get("frozen"):
+                slots.append("__spec_hash__")
+
+            if kwargs.get("extra") == "collect":
+                slots.append("__extra__")
+
+            if kwargs.get("cache"):
+                slots.extend(("__spec_cache__", "__spec_owners__"))
+
+                # models holding this one are linked weakly
+                if not any(hasattr(base, "__weakref__") for base in bases):
+                    slots.append("__weakref__")
+
+            namespace["__slots__"] = tuple(slots)
+
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+class Model(metaclass=ModelMeta):
+    __slots__ = ()
+
     _items: dict[str, InternalItem]
+    _validators: dict[str, tuple[str, Validator]]
+    _required: frozenset[str]
+    _tagged: bool
+    _values: Callable[[Model], Any]
+    _rename_scheme: type[RenameScheme]
+    _frozen: bool = False
+    _lazy: bool = False
+    _extra: Literal["ignore", "forbid", "collect"] = "ignore"
+    _profile: bool = False
+    _cache: bool = False
+    _validate_assignment: bool = False
+    _plan: tuple[tuple[str, str, Validator], ...]
+    _defaults: tuple[tuple[str, str, Callable[[], Any]], ...]
     _type_name: str
 
-    def __init_subclass__(cls, type_name: str | None = None, rename: type[RenameScheme] = Default) -> None:
-        items: dict[str, InternalItem] = {}
+    # only models with tagged unions give their instances a tag map of their own
+    __tag_map__: Mapping[str, Any] = NO_TAGS
 
+    def __init_subclass__(cls, type_name: str | None = None, rename: type[RenameScheme] = Default, slots: bool = False, frozen: bool = False, lazy: bool = False, extra: Literal["ignore", "forbid", "collect"] = "ignore", profile: bool | None = None, defer: bool = False, validate_assignment: bool = False, cache: bool = False) -> None:
         cls._type_name = type_name or cls.__name__
+        cls._rename_scheme = rename
+        cls._lazy = lazy
+        cls._extra = extra
+        cls._cache = cache
+        cls._validate_assignment = validate_assignment
+        cls._profile = profiler.enabled if profile is None else profile
+
+        if defer:
+            # the schema is built the first time anything reads it, usually the first instance
+            for name in _SCHEMA_ATTRIBUTES:
+                setattr(cls, name, _DeferredSchema(name))
+        else:
+            cls._build()
+
+        # profiling is decided here so models which aren't profiled never pay for it
+        populate = cls._populate
+        unwrapped = getattr(populate, "__wrapped__", populate)
+
+        if cls._profile:
+            cls._populate = profiler.instrument_populate(StatsKey(cls), unwrapped)  # type: ignore
+        elif unwrapped is not populate:
+            cls._populate = unwrapped  # type: ignore
+
+        if frozen:
+            cls._frozen = True
+            cls.__setattr__ = _frozen_setattr
+            cls.__delattr__ = _frozen_delattr
+            cls.__hash__ = _frozen_hash  # type: ignore
+            cls.__setstate__ = _frozen_setstate
+
+        elif cache:
+            cls.__setattr__ = _cached_setattr
+            cls.__delattr__ = _cached_delattr
+
+        elif validate_assignment:
+            cls.__setattr__ = _validated_setattr
+
+        if cache:
+            # the output is kept until the model or anything inside it changes
+            cls.to_dict = _cached_to_dict  # type: ignore
+            cls.to_json = _cached_to_json  # type: ignore
+            cls._write_json = _cached_write_json  # type: ignore
+            cls.__getstate__ = _cached_getstate
+
+    @classmethod
+    def _build(cls) -> None:
+        items: dict[str, InternalItem] = {}
+        rename = cls._rename_scheme
+        class_defaults: dict[str, Any] | None = cls.__dict__.get("__spec_defaults__")
 
         for key, annotation in cls.__annotations__.items():
-            it = convert_to_item(cls, key, annotation)
+            cached = schema_item(cls, key, annotation)
 
-            if "rename" not in it._modified and it._rename is None:
-                it._rename = rename.rename(key)
+            # compiled once on the shared item so every copy made below reuses the validator
+            if cached.validator is None:
+                cached.validator = compile_validator(cached)
 
-            item = it._to_internal()
+            if class_defaults is not None:
+                default = class_defaults.get(key, Missing)
+            else:
+                default = getattr(cls, key, Missing)
 
-            if (default := getattr(cls, key, Missing)) is not Missing:
-                item.default = lambda: default
+            item = _copy_item(
+                cached,
+                rename=cached.rename or rename.rename(key),
+                default=cached.default if default is Missing else lambda default=default: default
+            )
 
             items[item.actual_key] = item
 
         cls._items = items
+        cls._compile()
+
+    @classmethod
+    def _compile(cls) -> None:
+        validators: dict[str, tuple[str, Validator]] = {}
+
+        for key, item in cls._items.items():
+            if item.validator is None:
+                item.validator = compile_validator(item)
+
+            validator = cls._profile_validator(item) if cls._profile else item.validator
+
+            if cls._lazy and not is_plain(item):
+                # the raw value is kept and only validated once the attribute is read
+                setattr(cls, item.key, LazyField(item.key, validator, cls.__dict__.get(item.key), key))
+                validators[key] = (item.key, _defer)
+            else:
+                validators[key] = (item.key, validator)
+
+        cls._validators = validators
+        cls._plan = tuple((key, attr, validator) for key, (attr, validator) in validators.items())
+        cls._required = frozenset(key for key, item in cls._items.items() if not item.default)
+        cls._defaults = tuple((key, item.key, item.default) for key, item in cls._items.items() if item.default)
+        cls._tagged = any(is_tagged(item) for item in cls._items.values())
+        cls._values = attrgetter(*attrs) if (attrs := [item.key for item in cls._items.values()]) else _no_values
+
+        # slotted models without tagged unions never fill their tag map slot, reading it gives NO_TAGS instead
+        if (slot := next(base.__dict__["__tag_map__"] for base in cls.__mro__ if "__tag_map__" in base.__dict__)) is not NO_TAGS:
+            storage = slot.storage if isinstance(slot, TagMapSlot) else slot
+            cls.__tag_map__ = storage if cls._tagged else TagMapSlot(storage)  # type: ignore
+
+        # only needed for serializing and `construct`, so they are compiled the first time they are used
+        for name in _ON_DEMAND_ATTRIBUTES:
+            setattr(cls, name, Model.__dict__[name])
+
+    @_OnDemand
+    def _plain(cls) -> frozenset[str]:
+        return frozenset(key for key, item in cls._items.items() if is_plain(item))
+
+    @_OnDemand
+    def _serializers(cls) -> tuple[tuple[str, str, Serializer | None], ...]:
+        return tuple((key, item.key, compile_serializer(item)) for key, item in cls._items.items())
+
+    @_OnDemand
+    def _is_async(cls) -> bool:
+        return any(is_async(item) for item in cls._items.values())
+
+    @_OnDemand
+    def _async_plan(cls) -> tuple[tuple[str, str, Validator, AsyncValidator | None], ...]:
+        return tuple(
+            (key, attr, validator, compile_async_validator(item) if is_async(item) else None)
+            for (key, attr, validator), item in zip(cls._plan, cls._items.values())
+        )
+
+    @_OnDemand
+    def _assignments(cls) -> dict[str, tuple[str, Validator]]:
+        # the validators of `_validators` keyed by attribute rather than key
+        return {attr: (key, validator) for key, (attr, validator) in cls._validators.items()}
+
+    @_OnDemand
+    def _builders(cls) -> tuple[tuple[str, str, Callable[[], Any] | None, Builder | None], ...]:
+        return tuple((key, item.key, item.default, compile_builder(item)) for key, item in cls._items.items())
+
+    @classmethod
+    def _profile_validator(cls, item: InternalItem[Any]) -> Validator:
+        # a separate validator is compiled as the one cached on the item is shared with unprofiled models
+        def instrument(variant: str, validator: Validator) -> Validator:
+            return profiler.instrument(StatsKey(cls, item.key, variant), validator)
+
+        return profiler.instrument(StatsKey(cls, item.key), compile_validator(item, instrument=instrument))
 
     def __init__(self, data: dict[str, Any] | None = None, /, **kwargs: Any):
-        self.__tag_map__: dict[str, str] = {}
-
         if data is None and not kwargs:
             raise MissingArgument("No data or kwargs passed to Model")
 
-        data = data or kwargs
+        self._populate(data or kwargs)
 
-        for key, item in self._items.items():
+    def _populate(self, data: dict[str, Any]) -> None:
+        # frozen models block __setattr__, so attributes are always set through object
+        set_field = object.__setattr__
+
+        if self._tagged:
+            set_field(self, "__tag_map__", {})
+
+        try:
+            keys = data.keys()
+        except AttributeError:
+            self._raise_invalid(data)
+
+        if not keys >= self._required:
+            self._raise_missing(data)
+
+        get = data.get
+        found = 0
+
+        try:
+            for key, attr, validator in self._plan:
+                if (value := get(key, Missing)) is not Missing:
+                    set_field(self, attr, validator(self, value))
+                    found += 1
+        except PathError as e:
+            e._in(self.__class__, key)
+            raise
+
+        for key, attr, default in self._defaults:
+            if key not in data:
+                set_field(self, attr, default())
+
+        # collected keys are always set, even when there are none
+        if (found != len(data) and self._extra != "ignore") or self._extra == "collect":
+            self._handle_extra(data)
+
+    @classmethod
+    async def avalidate(cls, data: Any, /, *, max_concurrency: int = 100) -> Self:
+        # fields with async validators or hooks are validated concurrently, at most `max_concurrency`
+        # of the async callables run at once. models without any are validated synchronously
+        return await cls._avalidate(data, asyncio.Semaphore(max_concurrency))
+
+    @classmethod
+    async def _avalidate(cls, data: Any, semaphore: asyncio.Semaphore) -> Self:
+        if not cls._is_async:
+            return cls(data)
+
+        instance = cls.__new__(cls)
+        await instance._apopulate(data, semaphore)
+
+        return instance
+
+    async def _apopulate(self, data: dict[str, Any], semaphore: asyncio.Semaphore) -> None:
+        set_field = object.__setattr__
+
+        if self._tagged:
+            set_field(self, "__tag_map__", {})
+
+        try:
+            keys = data.keys()
+        except AttributeError:
+            self._raise_invalid(data)
+
+        if not keys >= self._required:
+            self._raise_missing(data)
+
+        get = data.get
+        found = 0
+        pending: list[tuple[str, str, Coroutine[Any, Any, Any]]] = []
+
+        try:
+            for key, attr, validator, async_validator in self._async_plan:
+                if (value := get(key, Missing)) is not Missing:
+                    if async_validator is None:
+                        set_field(self, attr, validator(self, value))
+                    else:
+                        pending.append((key, attr, async_validator(self, value, semaphore)))
+
+                    found += 1
+        except PathError as e:
+            for _, _, coroutine in pending:
+                coroutine.close()
+
+            e._in(self.__class__, key)
+            raise
+
+        results = await _gather([_in_field(coroutine, self.__class__, key) for key, _, coroutine in pending])
+
+        for (_, attr, _), result in zip(pending, results):
+            set_field(self, attr, result)
+
+        for key, attr, default in self._defaults:
             if key not in data:
-                if item.default:
-                    setattr(self, item.key, item.default())
-                else:
-                    raise MissingRequiredKey(f"Missing required key {self.__class__.__name__}.{key}")
+                set_field(self, attr, default())
+
+        # collected keys are always set, even when there are none
+        if (found != len(data) and self._extra != "ignore") or self._extra == "collect":
+            self._handle_extra(data)
+
+    def _raise_invalid(self, data: Any) -> NoReturn:
+        # records which aren't objects, such as a json null in a batch, fail like any other bad value
+        if data is None:
+            raise MissingArgument(f"No data passed to {self.__class__.__name__}")
+
+        raise InvalidType(self.__class__, schema_item(self.__class__, self.__class__.__name__, self.__class__), data)
+
+    def _raise_missing(self, data: dict[str, Any]) -> NoReturn:
+        raise MissingRequiredKey(self.__class__, next(key for key in self._items if key in self._required and key not in data))
+
+    def _handle_extra(self, data: dict[str, Any]) -> None:
+        extra = {key: value for key, value in data.items() if key not in self._items}
+
+        if self._extra == "forbid":
+            raise UnknownKey(self.__class__, list(extra))
+
+        object.__setattr__(self, "__extra__", extra)
+
+    def update(self, data: dict[str, Any], /) -> None:
+        # validates and sets only the keys in `data`, nothing is changed unless every key is valid
+        if self._frozen:
+            raise FrozenInstance(f"Cannot update a frozen model {self.__class__.__name__}")
 
-        for key, value in data.items():
-            if not (item := self._items.get(key)):
-                continue
+        validators = self._validators
+        tag_map = dict(self.__tag_map__) if self._tagged else None
+        changes: list[tuple[str, Any]] = []
+        extra: dict[str, Any] = {}
 
-            new_value = validate(item, self, value)
+        try:
+            for key, value in data.items():
+                if (entry := validators.get(key)) is None:
+                    extra[key] = value
+                    continue
 
-            setattr(self, item.key, new_value)
+                attr, validator = entry
+
+                try:
+                    changes.append((attr, validator(self, value)))
+                except PathError as e:
+                    e._in(self.__class__, key)
+                    raise
+
+            if extra and self._extra == "forbid":
+                raise UnknownKey(self.__class__, list(extra))
+        except Exception:
+            # tagged unions record their variant while validating, which is undone when any key fails
+            if tag_map is not None:
+                object.__setattr__(self, "__tag_map__", tag_map)
+
+            raise
+
+        set_field = object.__setattr__
+
+        if extra and self._extra == "collect":
+            set_field(self, "__extra__", {**getattr(self, "__extra__", {}), **extra})
+
+        for attr, value in changes:
+            set_field(self, attr, value)
+
+        if self._cache:
+            invalidate(self)
+
+    def _output_cache(self) -> dict[Any, Any]:
+        # the cached output keyed by None for `to_dict` and by the writer options for json. everything
+        # inside is adopted before anything is cached, which is repeated after any change
+        if (cache := getattr(self, "__spec_cache__", None)) is None:
+            set_field = object.__setattr__
+
+            for item in self._items.values():
+                value = getattr(self, item.key)
+
+                if (adopted := _adopt(value, self)) is not value:
+                    set_field(self, item.key, adopted)
+
+            cache = {}
+            set_field(self, "__spec_cache__", cache)
+
+        return cache
+
+    @classmethod
+    def construct(cls, data: dict[str, Any] | None = None, /, **kwargs: Any) -> Self:
+        # builds an instance from already validated data, only renames and defaults are applied
+        if data is None and not kwargs:
+            raise MissingArgument("No data or kwargs passed to Model")
+
+        instance = cls.__new__(cls)
+        instance._construct(data or kwargs)
+
+        return instance
+
+    def _construct(self, data: dict[str, Any]) -> None:
+        set_field = object.__setattr__
+
+        if self._tagged:
+            set_field(self, "__tag_map__", {})
+
+        try:
+            keys = data.keys()
+        except AttributeError:
+            self._raise_invalid(data)
+
+        if not keys >= self._required:
+            self._raise_missing(data)
+
+        for key, attr, default, builder in self._builders:
+            if key in data:
+                value = data[key]
+
+                set_field(self, attr, value if builder is None else builder(self, value))
+
+            elif default:
+                set_field(self, attr, default())
+
+        if self._extra == "collect":
+            set_field(self, "__extra__", {key: value for key, value in data.items() if key not in self._items})
+
+    @overload
+    @classmethod
+    def validate_many(cls, data: Iterable[Any], *, collect_errors: Literal[False] = False) -> list[Self]:
+        ...
+
+    @overload
+    @classmethod
+    def validate_many(cls, data: Iterable[Any], *, collect_errors: Literal[True]) -> tuple[list[Self], list[tuple[int, SpecError]]]:
+        ...
+
+    @classmethod
+    def validate_many(cls, data: Iterable[Any], *, collect_errors: bool = False) -> list[Self] | tuple[list[Self], list[tuple[int, SpecError]]]:
+        new = cls.__new__
+        populate = cls._populate
+        output: list[Self] = []
+        append = output.append
+
+        if not collect_errors:
+            for record in data:
+                instance = new(cls)
+                populate(instance, record)
+                append(instance)
+
+            return output
+
+        errors: list[tuple[int, SpecError]] = []
+
+        for i, record in enumerate(data):
+            instance = new(cls)
+
+            try:
+                populate(instance, record)
+            except SpecError as e:
+                errors.append((i, e))
+            else:
+                append(instance)
+
+        return output, errors
 
     def to_dict(self) -> dict[str, Any]:
-        output: dict[str, Any] = {}
+        tag_map = self.__tag_map__ if self._tagged else NO_TAGS
+
+        return {
+            key: getattr(self, attr) if serialize is None else serialize(getattr(self, attr), tag_map)
+            for key, attr, serialize in self._serializers
+        }
+
+    def to_json(self, *, ensure_ascii: bool = True, separators: tuple[str, str] = (", ", ": ")) -> str:
+        parts: list[str] = []
+        self._write_json(JSONWriter(parts.append, ensure_ascii=ensure_ascii, separators=separators))
+
+        return "".join(parts)
+
+    def _write_json(self, writer: JSONWriter, extra: tuple[Any, Any] | None = None) -> None:
+        write = writer.write
+        tag_map = self.__tag_map__ if self._tagged else NO_TAGS
+        plain = self._plain
+        first = True
+
+        write("{")
 
         for item in self._items.values():
-            value = getattr(self, item.key)
-            output[item.actual_key] = value_to_dict(value, self.__tag_map__, item)
+            if first:
+                first = False
+            else:
+                write(writer.item_separator)
+
+            write(writer.key(item.actual_key))
+            write(writer.key_separator)
 
-        return output
+            if item.actual_key in plain:
+                write(writer.encode(getattr(self, item.key)))
+            else:
+                writer.item(getattr(self, item.key), tag_map, item)
+
+        if extra is not None:
+            if not first:
+                write(writer.item_separator)
+
+            write(writer.key(extra[0]))
+            write(writer.key_separator)
+            writer.value(extra[1])
+
+        write("}")
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, self.__class__):
             return False
 
-        return self.to_dict() == other.to_dict()
+        # the values are read first as reading lazy fields fills in their tags
+        values = self._values(self)
+        other_values = self._values(other)
+
+        if self._tagged and self.__tag_map__ != other.__tag_map__:
+            return False
+
+        # compares the fields in order and stops at the first difference, nested models recurse through here
+        return values == other_values
 
     def __repr__(self) -> str:
         items: list[str] = []
@@ -355,31 +2017,72 @@ class Model:
 
 class TransparentModel(Generic[T], Model):
     def __init_subclass__(cls, *, item: Item | None = None) -> None:
-        ty = get_args(get_original_bases(cls)[0])[0]
+        # typing caches `TransparentModel[A | B]` and hands it back for `B | A` as well, so `transparent`
+        # records the union in the order it was written
+        ty = cls.__dict__.get("__spec_type__") or get_args(get_original_bases(cls)[0])[0]
 
-        cls._items = {"value": convert_to_item(cls, "value", ty, item)._to_internal()}
+        if item is None:
+            cls._items = {"value": schema_item(cls, "value", ty)}
+        else:
+            cls._items = {"value": convert_to_item(cls, "value", ty, item)._to_internal()}
+        cls._compile()
 
     def __init__(self, data: Any):
         self.value: T
 
-        super().__init__({"value": data})
+        self._populate(data)
+
+    def _populate(self, data: Any) -> None:
+        super()._populate({"value": data})
+
+    async def _apopulate(self, data: Any, semaphore: asyncio.Semaphore) -> None:
+        await super()._apopulate({"value": data}, semaphore)
+
+    @classmethod
+    def construct(cls, data: Any) -> Self:
+        instance = cls.__new__(cls)
+        instance._construct({"value": data})
+
+        return instance
 
     def to_dict(self) -> dict[str, Any]:
-        print(self._items["value"])
-        return value_to_dict(self.value, self.__tag_map__, self._items["value"])
+        _, _, serialize = self._serializers[0]
+
+        if serialize is None:
+            return self.value
+
+        return serialize(self.value, self.__tag_map__ if self._tagged else NO_TAGS)
+
+    def _write_json(self, writer: JSONWriter, extra: tuple[Any, Any] | None = None) -> None:
+        writer.item(self.value, self.__tag_map__ if self._tagged else NO_TAGS, self._items["value"])
 
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} {self.value!r}>"
 
+_transparent_cache: dict[tuple[Any, Item | None], type[TransparentModel[Any]]] = {}
+
 def transparent(ty: type[T], item: Item | None = None) -> type[TransparentModel[T]]:
+    cache_key = (_annotation_key(ty), item)
+
+    try:
+        if (cached := _transparent_cache.get(cache_key)) is not None:
+            return cached
+
+        hashable = True
+    except TypeError:
+        hashable = False
+
     if is_union(ty):
         name = "Or".join([get_type_name(v) for v in get_args(ty)])
     else:
         name = get_type_name(ty)
 
     class Mod(TransparentModel[ty], item=item):
-        pass
+        __spec_type__ = ty
 
     Mod.__name__ = name
 
+    if hashable:
+        _transparent_cache[cache_key] = Mod
+
     return Mod
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import os
+import pickle
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Iterable, Literal, TypeVar, overload
+
+from .errors import SpecError
+from .model import Model
+
+__all__ = ("validate_parallel",)
+
+M = TypeVar("M", bound=Model)
+
+def _validate_chunk(cls: type[Model], records: list[Any]) -> list[tuple[bool, Any]]:
+    new = cls.__new__
+    populate = cls._populate
+    output: list[tuple[bool, Any]] = []
+
+    for record in records:
+        instance = new(cls)
+
+        try:
+            populate(instance, record)
+        except SpecError as e:
+            output.append((False, e))
+        else:
+            output.append((True, instance))
+
+    return output
+
+def _is_picklable(obj: Any) -> bool:
+    try:
+        pickle.dumps(obj)
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return False
+
+    return True
+
+@overload
+def validate_parallel(cls: type[M], data: Iterable[Any], *, chunk_size: int = ..., max_workers: int | None = ..., executor: Executor | None = ..., collect_errors: Literal[False] = False) -> list[M]:
+    ...
+
+@overload
+def validate_parallel(cls: type[M], data: Iterable[Any], *, chunk_size: int = ..., max_workers: int | None = ..., executor: Executor | None = ..., collect_errors: Literal[True]) -> tuple[list[M], list[tuple[int, SpecError]]]:
+    ...
+
+def validate_parallel(cls: type[M], data: Iterable[Any], *, chunk_size: int = 1000, max_workers: int | None = None, executor: Executor | None = None, collect_errors: bool = False) -> list[M] | tuple[list[M], list[tuple[int, SpecError]]]:
+    # worker processes look the model up by its import path, classes which cant be pickled
+    # (such as ones made inside functions by `transparent`) are validated in this process instead
+    if not _is_picklable(cls):
+        return cls.validate_many(data, collect_errors=collect_errors)  # type: ignore
+
+    owns_executor = executor is None
+    pool = executor or ProcessPoolExecutor(max_workers)
+    max_pending = 2 * (max_workers or os.cpu_count() or 1)
+
+    output: list[M] = []
+    errors: list[tuple[int, SpecError]] = []
+    pending: deque[tuple[list[Any], Future[list[tuple[bool, Any]]]]] = deque()
+    records = iter(data)
+    index = 0
+
+    def collect(chunk: list[Any], future: Future[list[tuple[bool, Any]]]) -> None:
+        nonlocal index
+
+        try:
+            results = future.result()
+        except (pickle.PicklingError, TypeError, AttributeError):
+            # a hook produced a value which cant be sent back, redo the chunk here
+            results = _validate_chunk(cls, chunk)
+
+        for ok, result in results:
+            if ok:
+                output.append(result)
+            elif collect_errors:
+                errors.append((index, result))
+            else:
+                raise result
+
+            index += 1
+
+    try:
+        while chunk := list(islice(records, chunk_size)):
+            pending.append((chunk, pool.submit(_validate_chunk, cls, chunk)))
+
+            if len(pending) >= max_pending:
+                collect(*pending.popleft())
+
+        while pending:
+            collect(*pending.popleft())
+    finally:
+        for _, future in pending:
+            future.cancel()
+
+        if owns_executor:
+            pool.shutdown()
+
+    if collect_errors:
+        return output, errors
+
+    return output
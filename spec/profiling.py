@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple, TypedDict
+
+if TYPE_CHECKING:
+    from .model import Model, Validator
+
+__all__ = ("StatsKey", "Stats", "StatsSnapshot", "Profiler", "profiler", "enable", "disable")
+
+class StatsKey(NamedTuple):
+    # keyed by the class itself so models sharing a name in different modules are kept apart
+    model: type[Model]
+    field: str | None = None
+    variant: str | None = None
+
+    def __str__(self) -> str:
+        name = f"{self.model.__module__}.{self.model.__qualname__}"
+
+        if self.field is not None:
+            name += f".{self.field}"
+
+        if self.variant is not None:
+            name += f"[{self.variant}]"
+
+        return name
+
+class StatsSnapshot(TypedDict):
+    calls: int
+    failures: int
+    time: float
+
+class Stats:
+    __slots__ = ("calls", "failures", "time")
+
+    def __init__(self):
+        self.calls = 0
+        self.failures = 0
+        self.time = 0.0
+
+    def snapshot(self) -> StatsSnapshot:
+        return {"calls": self.calls, "failures": self.failures, "time": self.time}
+
+    def __repr__(self) -> str:
+        return f"<Stats calls={self.calls} failures={self.failures} time={self.time:.6f}>"
+
+class Profiler:
+    # stats are kept per model, per field and per union variant. the wrappers hold on to their stats
+    # objects so resetting zeroes them in place rather than replacing them
+    def __init__(self):
+        self.enabled = False
+        self._stats: dict[StatsKey, Stats] = {}
+
+    def stats(self, key: StatsKey) -> Stats:
+        if (stats := self._stats.get(key)) is None:
+            stats = self._stats[key] = Stats()
+
+        return stats
+
+    def snapshot(self) -> dict[StatsKey, StatsSnapshot]:
+        return {key: stats.snapshot() for key, stats in self._stats.items() if stats.calls}
+
+    def reset(self) -> None:
+        for stats in self._stats.values():
+            stats.calls = 0
+            stats.failures = 0
+            stats.time = 0.0
+
+    def instrument(self, key: StatsKey, validator: Validator) -> Validator:
+        stats = self.stats(key)
+
+        def profiled(model: Model, value: Any) -> Any:
+            start = perf_counter()
+
+            try:
+                return validator(model, value)
+            except Exception:
+                stats.failures += 1
+                raise
+            finally:
+                stats.calls += 1
+                stats.time += perf_counter() - start
+
+        return profiled
+
+    def instrument_populate(self, key: StatsKey, populate: Callable[[Model, Any], None]) -> Callable[[Model, Any], None]:
+        stats = self.stats(key)
+
+        def profiled(model: Model, data: Any) -> None:
+            start = perf_counter()
+
+            try:
+                populate(model, data)
+            except Exception:
+                stats.failures += 1
+                raise
+            finally:
+                stats.calls += 1
+                stats.time += perf_counter() - start
+
+        profiled.__wrapped__ = populate  # type: ignore
+
+        return profiled
+
+profiler = Profiler()
+
+def enable() -> None:
+    # only affects models defined afterwards, profiling is chosen when the class is built
+    profiler.enabled = True
+
+def disable() -> None:
+    profiler.enabled = False
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import codecs
+import json
+from typing import IO, Any, AsyncIterable, AsyncIterator, Iterator, Protocol, TypeVar
+
+from .model import Model
+
+__all__ = ("JSONStreamDecoder", "iter_json", "aiter_json")
+
+M = TypeVar("M", bound=Model)
+
+WHITESPACE = " \t\n\r"
+
+class AsyncReader(Protocol):
+    async def read(self, n: int = ..., /) -> bytes | str:
+        ...
+
+class JSONStreamDecoder:
+    # decodes the values of a top level json array, or a stream of values separated by
+    # whitespace such as ndjson, as the text arrives. only the text of values which are not
+    # complete yet is kept around.
+
+    def __init__(self):
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._state = "start"
+
+    def feed(self, data: bytes | str, eof: bool = False) -> list[Any]:
+        if isinstance(data, bytes):
+            data = self._text_decoder.decode(data, eof)
+
+        buffer = self._buffer + data
+        end = len(buffer)
+        pos = 0
+        values: list[Any] = []
+
+        while True:
+            while pos < end and buffer[pos] in WHITESPACE:
+                pos += 1
+
+            if pos == end:
+                break
+
+            char = buffer[pos]
+
+            match self._state:
+                case "start":
+                    if char == "[":
+                        self._state = "array"
+                        pos += 1
+                    else:
+                        self._state = "values"
+
+                    continue
+
+                case "array" | "array_next" if char == "]":
+                    self._state = "done"
+                    pos += 1
+
+                    continue
+
+                case "array_next":
+                    if char != ",":
+                        raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+
+                    self._state = "array_value"
+                    pos += 1
+
+                    continue
+
+                case "done":
+                    raise json.JSONDecodeError("Extra data", buffer, pos)
+
+            try:
+                value, value_end = self._decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+
+                break
+
+            # a number at the end of the buffer might still have more digits coming
+            if value_end == end and not eof:
+                break
+
+            values.append(value)
+            pos = value_end
+
+            if self._state != "values":
+                self._state = "array_next"
+
+        self._buffer = buffer[pos:]
+
+        if eof and self._state not in ("start", "values", "done"):
+            raise json.JSONDecodeError("Unterminated array", buffer, pos)
+
+        return values
+
+def iter_json(cls: type[M], fp: IO[bytes] | IO[str], *, chunk_size: int = 65536) -> Iterator[M]:
+    decoder = JSONStreamDecoder()
+    size = chunk_size
+
+    while chunk := fp.read(size):
+        values = decoder.feed(chunk)
+
+        # grow the reads while a single large value is being buffered so it isnt re-parsed for every chunk
+        size = chunk_size if values else size * 2
+
+        for value in values:
+            yield cls(value)
+
+    for value in decoder.feed(b"", eof=True):
+        yield cls(value)
+
+async def aiter_json(cls: type[M], stream: AsyncReader | AsyncIterable[bytes | str], *, chunk_size: int = 65536) -> AsyncIterator[M]:
+    decoder = JSONStreamDecoder()
+
+    if hasattr(stream, "read"):
+        async def read_chunks() -> AsyncIterator[bytes | str]:
+            while chunk := await stream.read(chunk_size):  # type: ignore
+                yield chunk
+
+        chunks = read_chunks()
+    else:
+        chunks = stream
+
+    async for chunk in chunks:  # type: ignore
+        for value in decoder.feed(chunk):
+            yield cls(value)
+
+    for value in decoder.feed(b"", eof=True):
+        yield cls(value)
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+from weakref import ref
+
+__all__ = ("TrackedList", "TrackedDict", "TrackedSet", "invalidate")
+
+def invalidate(model: Any) -> None:
+    # called when a model itself changes, it is walked again the next time its output is cached
+    if (cache := getattr(model, "__spec_cache__", None)) is None:
+        return
+
+    object.__setattr__(model, "__spec_cache__", None)
+
+    if cache:
+        _outdate_owners(model)
+
+def _outdate(model: Any) -> None:
+    # called when a model inside this one changes, its containers are still tracked so only the output goes
+    if cache := getattr(model, "__spec_cache__", None):
+        cache.clear()
+        _outdate_owners(model)
+
+def _outdate_owners(model: Any) -> None:
+    # output is only ever cached after the output of every model inside it, so a model without any
+    # cached output has nothing cached above it either
+    for owner_ref in list(getattr(model, "__spec_owners__", {}).values()):
+        if (owner := owner_ref()) is not None:
+            _outdate(owner)
+
+def link(model: Any, owner: Any) -> None:
+    # models aren't hashable so owners are kept by id, each entry removes itself once its owner is gone
+    if (owners := getattr(model, "__spec_owners__", None)) is None:
+        owners = {}
+        object.__setattr__(model, "__spec_owners__", owners)
+
+    key = id(owner)
+
+    if (owner_ref := owners.get(key)) is None or owner_ref() is not owner:
+        owners[key] = ref(owner, lambda _, key=key: owners.pop(key, None))
+
+def _mutator(method: Callable[..., Any]) -> Callable[..., Any]:
+    def mutate(self: Any, *args: Any, **kwargs: Any) -> Any:
+        # containers copied out of a model have no owner
+        if (owner := getattr(self, "owner", None)) is not None:
+            invalidate(owner)
+
+        return method(self, *args, **kwargs)
+
+    mutate.__name__ = method.__name__
+
+    return mutate
+
+def _tracked(base: type, methods: tuple[str, ...]) -> type:
+    # a subclass of `base` whose in place changes invalidate the model it belongs to, pickling and
+    # copying turns it back into the plain type
+    namespace: dict[str, Any] = {name: _mutator(getattr(base, name)) for name in methods}
+    namespace["__slots__"] = ("owner",)
+    namespace["__reduce__"] = lambda self: (base, (base(self),))
+
+    return type(f"Tracked{base.__name__.capitalize()}", (base,), namespace)
+
+TrackedList = _tracked(list, ("__setitem__", "__delitem__", "__iadd__", "__imul__", "append", "extend", "insert", "pop", "remove", "clear", "sort", "reverse"))
+TrackedDict = _tracked(dict, ("__setitem__", "__delitem__", "__ior__", "pop", "popitem", "clear", "update", "setdefault"))
+TrackedSet = _tracked(set, ("__ior__", "__iand__", "__isub__", "__ixor__", "add", "discard", "remove", "pop", "clear", "update", "intersection_update", "difference_update", "symmetric_difference_update"))
+
+# the plain type each tracked container stands in for
+UNTRACKED: dict[type, type] = {TrackedList: list, TrackedDict: dict, TrackedSet: set}
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from itertools import islice
 from typing import Any, cast, get_origin as _get_origin, TYPE_CHECKING, Literal, Union
 from types import UnionType
 from typing_extensions import TypeVar
@@ -12,8 +13,15 @@ __all__ = ("UniqueList", "_Missing", "Missing", "is_union", "get_origin", "get_o
 T = TypeVar("T", default=Any)
 
 class UniqueList(list[T]):
+    # keeps the order values were first seen in, membership is checked against a set
+    def __init__(self, *args: Any):
+        super().__init__(*args)
+
+        self._seen: set[T] = set(self)
+
     def append(self, value: T):
-        if value not in self:
+        if value not in self._seen:
+            self._seen.add(value)
             super().append(value)
 
 class _Missing:
@@ -51,14 +59,22 @@ def pretty_type(item: InternalItem) -> str:
 def to_union(types: list[Any]) -> str:
     return " | ".join(types or ["Unknown"])
 
-def generate_type_from_data(data: Any) -> str:
+# only this many values of each container are looked at, and only this many containers deep,
+# so describing a huge value in an error message stays cheap
+SAMPLE_SIZE = 10
+SAMPLE_DEPTH = 4
+
+def generate_type_from_data(data: Any, depth: int = SAMPLE_DEPTH) -> str:
     ty = type(data)
 
-    if isinstance(data, (list, set, tuple)):
+    if depth == 0:
+        generics = []
+
+    elif isinstance(data, (list, set, tuple)):
         types = UniqueList()
 
-        for value in data:
-            types.append(generate_type_from_data(value))
+        for value in islice(data, SAMPLE_SIZE):
+            types.append(generate_type_from_data(value, depth - 1))
 
         generics = [to_union(types)]
 
@@ -66,9 +82,9 @@ def generate_type_from_data(data: Any) -> str:
         key_types = UniqueList()
         value_types = UniqueList()
 
-        for key, value in data.items():
-            key_types.append(generate_type_from_data(key))
-            value_types.append(generate_type_from_data(value))
+        for key, value in islice(data.items(), SAMPLE_SIZE):
+            key_types.append(generate_type_from_data(key, depth - 1))
+            value_types.append(generate_type_from_data(value, depth - 1))
 
         generics = [to_union(key_types), to_union(value_types)]
     else:
@@ -0,0 +1,148 @@
+from array import array
+from typing import Annotated, Optional
+import unittest
+
+import spec
+from spec.columnar import numpy
+
+class Row(spec.Model, rename=spec.CamelCase):
+    row_id: int
+    score: float
+    active: bool
+    name: str
+    tags: list[str]
+    parent: Optional[int]
+
+class Inner(spec.Model):
+    value: int
+
+class Other(spec.Model):
+    text: str
+
+class Checked(spec.Model, extra="forbid"):
+    id: Annotated[int, spec.validate(lambda x: x >= 0)]
+    name: Annotated[str, spec.hook(str.upper)]
+    inner: Inner
+    part: Annotated[Inner | Other, spec.tag("external")]
+    note: Optional[str]
+
+CHECKED = {
+    "id": array("q", [1, 2]),
+    "name": ["a", "b"],
+    "inner": [{"value": 1}, {"value": 2}],
+    "part": [{"Inner": {"value": 3}}, {"Other": {"text": "c"}}],
+}
+
+DATA = [
+    {"rowId": 1, "score": 0.5, "active": True, "name": "a", "tags": ["x"], "parent": None},
+    {"rowId": 2, "score": 1.5, "active": False, "name": "bé", "tags": [], "parent": 1},
+]
+
+class TestToColumns(unittest.TestCase):
+    def test_instances(self):
+        columns = spec.to_columns(Row, [Row(row) for row in DATA], backend="array")
+
+        self.assertEqual(columns["rowId"], array("q", [1, 2]))
+        self.assertEqual(columns["score"], array("d", [0.5, 1.5]))
+        self.assertEqual(columns["active"], array("b", [1, 0]))
+        self.assertEqual(columns["name"], ["a", "bé"])
+        self.assertEqual(columns["tags"], [["x"], []])
+        self.assertEqual(columns["parent"], [None, 1])
+
+    def test_raw_dicts(self):
+        self.assertEqual(spec.to_columns(Row, DATA, backend="array"), spec.to_columns(Row, [Row(row) for row in DATA], backend="array"))
+        self.assertEqual(spec.to_columns(Row, [{**DATA[0], "parent": None}, {k: v for k, v in DATA[1].items() if k != "parent"}], backend="array")["parent"], [None, None])
+
+    def test_string_offsets(self):
+        column = spec.to_columns(Row, DATA, backend="array", strings="offsets")["name"]
+
+        self.assertEqual(column.offsets, array("q", [0, 1, 4]))
+        self.assertEqual(column.data, "abé".encode())
+        self.assertEqual(list(column), ["a", "bé"])
+        self.assertEqual(column[-1], "bé")
+        self.assertEqual(len(column), 2)
+
+    def test_invalid(self):
+        with self.assertRaises(spec.InvalidType) as cm:
+            spec.to_columns(Row, [DATA[0], {**DATA[1], "score": 1}], backend="array")
+
+        self.assertEqual(str(cm.exception), "Row[1].score expected type float but found int")
+
+        with self.assertRaises(spec.MissingRequiredKey) as cm:
+            spec.to_columns(Row, [DATA[0], {}], backend="array")
+
+        self.assertEqual(str(cm.exception), "Missing required key Row[1].rowId")
+
+    def test_empty(self):
+        self.assertEqual(spec.to_columns(Row, [], backend="array")["rowId"], array("q"))
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy(self):
+        columns = spec.to_columns(Row, DATA, backend="numpy", strings="offsets")
+
+        self.assertEqual(columns["rowId"].dtype, numpy.int64)
+        self.assertEqual(columns["active"].tolist(), [True, False])
+        self.assertEqual(columns["parent"].dtype, object)
+        self.assertEqual(list(columns["name"]), ["a", "bé"])
+
+    def test_numpy_missing(self):
+        if numpy is not None:
+            self.skipTest("numpy is installed")
+
+        with self.assertRaises(ImportError):
+            spec.to_columns(Row, DATA, backend="numpy")
+
+class TestFromColumns(unittest.TestCase):
+    def test_round_trip(self):
+        rows = [Row(row) for row in DATA]
+
+        self.assertEqual(spec.from_columns(Row, spec.to_columns(Row, rows, backend="array")), rows)
+        self.assertEqual(spec.from_columns(Row, {key: [row[key] for row in DATA] for key in DATA[0]}), rows)
+
+    def test_validated(self):
+        rows = spec.from_columns(Checked, CHECKED)
+
+        self.assertEqual(rows, [Checked({key: column[i] for key, column in CHECKED.items()}) for i in range(2)])
+        self.assertEqual(rows[1].name, "B")
+        self.assertIsNone(rows[0].note)
+        self.assertEqual(rows[1].to_dict()["part"], {"Other": {"text": "c"}})
+
+    def test_invalid(self):
+        with self.assertRaises(spec.InvalidType) as cm:
+            spec.from_columns(Checked, {**CHECKED, "id": array("d", [1.0, 2.0])})
+
+        self.assertEqual(str(cm.exception), "Checked[0].id expected type int but found float")
+
+        with self.assertRaises(spec.FailedValidation) as cm:
+            spec.from_columns(Checked, {**CHECKED, "id": [1, -1]})
+
+        self.assertEqual(str(cm.exception), "Checked[1].id failed validation")
+
+        with self.assertRaises(spec.InvalidType) as cm:
+            spec.from_columns(Checked, {**CHECKED, "inner": [{"value": 1}, {"value": "2"}]})
+
+        self.assertEqual(str(cm.exception), "Checked[1].inner.value expected type int but found str")
+
+        with self.assertRaises(spec.InvalidType):
+            spec.from_columns(Row, {**spec.to_columns(Row, DATA, backend="array"), "active": array("b", [1, 2])})
+
+    def test_columns(self):
+        with self.assertRaises(spec.MissingRequiredKey):
+            spec.from_columns(Checked, {key: value for key, value in CHECKED.items() if key != "inner"})
+
+        with self.assertRaises(spec.UnknownKey):
+            spec.from_columns(Checked, {**CHECKED, "other": [1, 2]})
+
+        with self.assertRaises(ValueError):
+            spec.from_columns(Checked, {**CHECKED, "name": ["a"]})
+
+        self.assertEqual(spec.from_columns(Checked, {}), [])
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_numpy(self):
+        rows = [Row(row) for row in DATA]
+
+        self.assertEqual(spec.from_columns(Row, spec.to_columns(Row, rows, backend="numpy")), rows)
+
+        with self.assertRaises(spec.InvalidType):
+            spec.from_columns(Checked, {**CHECKED, "id": numpy.array([1.0, 2.0])})
@@ -0,0 +1,69 @@
+from typing import Annotated
+import unittest
+
+import spec
+
+class Inner(spec.Model):
+    value: int
+
+class Record(spec.Model):
+    id: int
+    inner: Inner
+
+class Unpicklable(spec.Model):
+    value: Annotated[int, spec.hook(lambda x: lambda: x)]
+
+RECORDS = [{"id": i, "inner": {"value": i}} for i in range(25)]
+
+class TestValidateParallel(unittest.TestCase):
+    def test_matches_constructor(self):
+        output = spec.validate_parallel(Record, RECORDS, chunk_size=4, max_workers=2)
+
+        self.assertEqual(output, [Record(record) for record in RECORDS])
+
+    def test_fail(self):
+        with self.assertRaises(spec.InvalidType) as cm:
+            spec.validate_parallel(Record, [*RECORDS, {"id": "a", "inner": {"value": 1}}], chunk_size=4, max_workers=2)
+
+        self.assertEqual(str(cm.exception), "Record.id expected type int but found str")
+
+    def test_collect_errors(self):
+        data = [*RECORDS[:5], {"id": 5}, *RECORDS[6:]]
+
+        output, errors = spec.validate_parallel(Record, data, chunk_size=4, max_workers=2, collect_errors=True)
+
+        self.assertEqual(len(output), len(RECORDS) - 1)
+        self.assertEqual([i for i, _ in errors], [5])
+        self.assertIsInstance(errors[0][1], spec.MissingRequiredKey)
+
+    def test_non_object_records(self):
+        output, errors = spec.validate_parallel(Record, [*RECORDS[:5], None, *RECORDS[5:]], chunk_size=4, max_workers=2, collect_errors=True)
+
+        self.assertEqual(len(output), len(RECORDS))
+        self.assertEqual([i for i, _ in errors], [5])
+        self.assertIsInstance(errors[0][1], spec.MissingArgument)
+
+    def test_error_details(self):
+        data = [*RECORDS[:5], {"id": 5, "inner": {"value": "a"}}, *RECORDS[6:]]
+
+        _, errors = spec.validate_parallel(Record, data, chunk_size=4, max_workers=2, collect_errors=True)
+        error = errors[0][1]
+
+        self.assertEqual(error.path, ["inner", "value"])
+        self.assertEqual(error.location, "Record.inner.value")
+        self.assertIs(error.model, Record)
+        self.assertEqual(error.value, "a")
+        self.assertEqual(str(error), "Record.inner.value expected type int but found str")
+
+    def test_unpicklable_model(self):
+        model = spec.transparent(list[int])
+
+        self.assertEqual(spec.validate_parallel(model, [[1], [2]], max_workers=2), [model([1]), model([2])])
+
+    def test_unpicklable_result(self):
+        output = spec.validate_parallel(Unpicklable, [{"value": 1}, {"value": 2}], max_workers=2)
+
+        self.assertEqual([instance.value() for instance in output], [1, 2])
+
+if __name__ == "__main__":
+    unittest.main()
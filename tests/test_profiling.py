@@ -0,0 +1,119 @@
+from typing import Annotated
+import unittest
+
+import spec
+from spec.profiling import profiler
+
+class Created(spec.Model):
+    id: int
+
+class Deleted(spec.Model):
+    reason: str
+
+class Profiled(spec.Model, profile=True):
+    id: int
+    event: Created | Deleted
+    tagged: Annotated[Created | Deleted, spec.tag("external")]
+
+class Unprofiled(spec.Model):
+    id: int
+
+class Child(Profiled, profile=False):
+    pass
+
+DATA = {"id": 1, "event": {"reason": "spam"}, "tagged": {"Created": {"id": 2}}}
+
+class TestProfiling(unittest.TestCase):
+    def setUp(self):
+        profiler.reset()
+
+    def test_counts(self):
+        Profiled(DATA)
+        Profiled.validate_many([DATA, DATA])
+
+        stats = profiler.snapshot()
+
+        self.assertEqual(stats[(Profiled, None, None)]["calls"], 3)
+        self.assertEqual(stats[(Profiled, "id", None)]["calls"], 3)
+        self.assertEqual(stats[(Profiled, "tagged", "Created")]["calls"], 3)
+        self.assertNotIn((Profiled, "tagged", "Deleted"), stats)
+        self.assertGreater(stats[(Profiled, None, None)]["time"], 0)
+
+    def test_failures(self):
+        with self.assertRaises(spec.InvalidType):
+            Profiled({**DATA, "id": "a"})
+
+        stats = profiler.snapshot()
+
+        self.assertEqual(stats[(Profiled, None, None)]["failures"], 1)
+        self.assertEqual(stats[(Profiled, "id", None)]["failures"], 1)
+
+    def test_untagged_variants_tried(self):
+        Profiled(DATA)
+
+        stats = profiler.snapshot()
+
+        # the payload has no `id` so only the second variant is tried
+        self.assertNotIn((Profiled, "event", "Created"), stats)
+        self.assertEqual(stats[(Profiled, "event", "Deleted")]["calls"], 1)
+        self.assertEqual(stats[(Profiled, "event", "Deleted")]["failures"], 0)
+
+    def test_reset(self):
+        Profiled(DATA)
+        profiler.reset()
+
+        self.assertEqual(profiler.snapshot(), {})
+
+        Profiled(DATA)
+
+        self.assertEqual(profiler.snapshot()[(Profiled, None, None)]["calls"], 1)
+
+    def test_unprofiled(self):
+        Unprofiled({"id": 1})
+        Child(DATA)
+
+        self.assertEqual(profiler.snapshot(), {})
+        self.assertIs(Unprofiled._populate, spec.Model._populate)
+        self.assertIs(Child._populate, spec.Model._populate)
+
+    def test_keys(self):
+        Profiled(DATA)
+
+        key = next(key for key in profiler.snapshot() if key.variant is not None)
+
+        self.assertIs(key.model, Profiled)
+        self.assertEqual(str(key), f"{__name__}.Profiled.{key.field}[{key.variant}]")
+
+    def test_same_name(self):
+        def define() -> type[spec.Model]:
+            class Event(spec.Model, profile=True):
+                id: int
+
+            return Event
+
+        first, second = define(), define()
+        first({"id": 1})
+        second({"id": 1})
+        second({"id": 2})
+
+        stats = profiler.snapshot()
+
+        self.assertEqual(stats[(first, "id", None)]["calls"], 1)
+        self.assertEqual(stats[(second, "id", None)]["calls"], 2)
+
+    def test_enable(self):
+        spec.profiling.enable()
+
+        try:
+            class Enabled(spec.Model):
+                id: int
+        finally:
+            spec.profiling.disable()
+
+        class Disabled(spec.Model):
+            id: int
+
+        Enabled({"id": 1})
+        Disabled({"id": 1})
+
+        self.assertEqual(set(profiler.snapshot()), {(Enabled, None, None), (Enabled, "id", None)})
@@ -1,4 +1,8 @@
 from typing import Annotated, Optional
+import asyncio
+import io
+import json
+import pickle
 import unittest
 import spec
 
@@ -37,6 +41,34 @@ class Inner(spec.Model):
 class Outer(spec.Model):
     inner: Inner
 
+class TestValidateMany(unittest.TestCase):
+    INPUT = [{"inner": {"value": 1}}, {"inner": {"value": "2"}}, {"inner": {"value": 3}}]
+
+    def test_matches_constructor(self):
+        self.assertEqual(Outer.validate_many([self.INPUT[0], self.INPUT[2]]), [Outer(self.INPUT[0]), Outer(self.INPUT[2])])
+
+    def test_fail(self):
+        with self.assertRaises(spec.InvalidType):
+            Outer.validate_many(self.INPUT)
+
+    def test_collect_errors(self):
+        instances, errors = Outer.validate_many(self.INPUT, collect_errors=True)
+
+        self.assertEqual(instances, [Outer(self.INPUT[0]), Outer(self.INPUT[2])])
+        self.assertEqual([i for i, _ in errors], [1])
+        self.assertIsInstance(errors[0][1], spec.InvalidType)
+
+    def test_non_object_records(self):
+        instances, errors = Outer.validate_many([self.INPUT[0], None, 1], collect_errors=True)
+
+        self.assertEqual(instances, [Outer(self.INPUT[0])])
+        self.assertEqual([i for i, _ in errors], [1, 2])
+        self.assertIsInstance(errors[0][1], spec.MissingArgument)
+        self.assertEqual(str(errors[1][1]), "Outer expected type Outer but found int")
+
+        with self.assertRaises(spec.MissingArgument):
+            Outer.validate_many([None])
+
 class TestDeepModel(unittest.TestCase):
     INPUT = {"inner": {"value": 1}}
 
@@ -70,9 +102,64 @@ class TestListModel(unittest.TestCase):
     def test_to_dict(self):
         self.assertEqual(self.instance.to_dict(), self.INPUT)
 
+    def test_to_dict_copy(self):
+        self.instance.to_dict()["data"].append(4)
+
+        self.assertEqual(self.instance.data, [1, 2, 3])
+
+    def test_tagged_elements(self):
+        class TaggedList(spec.Model):
+            items: list[Annotated[PartA | PartB, spec.tag("external")]]
+            mapping: dict[str, Annotated[PartA | PartB, spec.tag("internal", tag="t")]]
+
+        instance = TaggedList({"items": [{"PartA": {"a": 1}}, {"PartB": {"b": "c"}}], "mapping": {"x": {"t": "PartA", "a": 1}}})
+        output = instance.to_dict()
+
+        self.assertEqual(output, {"items": [{"a": 1}, {"b": "c"}], "mapping": {"x": {"a": 1}}})
+        self.assertEqual(json.loads(instance.to_json()), output)
+
+    def test_to_dict_copy_union(self):
+        class OptionalList(spec.Model):
+            data: Optional[list[int]]
+            either: dict[str, int] | int
+
+        instance = OptionalList({"data": [1], "either": {"a": 1}})
+        output = instance.to_dict()
+
+        self.assertEqual(output, {"data": [1], "either": {"a": 1}})
+        self.assertIsNot(output["data"], instance.data)
+        self.assertIsNot(output["either"], instance.either)
+
     def test_repr(self):
         self.assertEqual(repr(self.instance), "<List data=[1, 2, 3]>")
 
+class Containers(spec.Model):
+    ints: list[int]
+    nested: list[list[int]]
+    mapping: dict[str, list[int]]
+    tags: set[str]
+    hooked: list[Annotated[int, spec.hook(lambda x: x + 1)]]
+
+class TestContainerReuse(unittest.TestCase):
+    def test_unchanged(self):
+        data = {"ints": [1, True], "nested": [[1]], "mapping": {"a": [1]}, "tags": {"a"}, "hooked": [1, 2]}
+        instance = Containers(data)
+
+        for key in ("ints", "nested", "mapping", "tags"):
+            self.assertIs(getattr(instance, key), data[key])
+
+        self.assertEqual(instance.hooked, [2, 3])
+
+    def test_invalid(self):
+        with self.assertRaises(spec.InvalidType):
+            Containers({"ints": [1, "2"], "nested": [], "mapping": {}, "tags": set(), "hooked": []})
+
+        with self.assertRaises(spec.InvalidType):
+            Containers({"ints": [], "nested": [[1, None]], "mapping": {}, "tags": set(), "hooked": []})
+
+        with self.assertRaises(spec.InvalidType):
+            Containers({"ints": [], "nested": [], "mapping": {1: []}, "tags": set(), "hooked": []})
+
 class ListOuter(spec.Model):
     inners: list[Inner]
 
@@ -251,6 +338,40 @@ class DefaultClsAttrUsage(unittest.TestCase):
     def test_value_value(self):
         self.assertEqual(self.instance.value, DefaultClsAttr.value)
 
+class MultipleDefaultClsAttr(spec.Model):
+    a: int = 1
+    b: str = "b"
+
+class MultipleDefaultClsAttrUsage(unittest.TestCase):
+    def test_values(self):
+        instance = MultipleDefaultClsAttr({})
+
+        self.assertEqual(instance.a, 1)
+        self.assertEqual(instance.b, "b")
+
+class NestedContainers(spec.Model):
+    data: dict[str, list[Inner]]
+
+class NestedContainersUsage(unittest.TestCase):
+    INPUT = {"data": {"a": [{"value": 1}], "b": []}}
+
+    def test_values(self):
+        instance = NestedContainers(self.INPUT)
+
+        self.assertEqual(instance.data, {"a": [Inner({"value": 1})], "b": []})
+
+    def test_invalid(self):
+        with self.assertRaises(spec.InvalidType):
+            NestedContainers({"data": {"a": [{"value": "1"}]}})
+
+    def test_to_dict(self):
+        self.assertEqual(NestedContainers(self.INPUT).to_dict(), self.INPUT)
+
+    def test_validate_function(self):
+        item = NestedContainers._items["data"]
+
+        self.assertEqual(spec.model.validate(item, NestedContainers(self.INPUT), {"c": []}), {"c": []})
+
 class Invalid(spec.Model):
     a: int
 
@@ -259,6 +380,20 @@ class InvalidUsage(unittest.TestCase):
         with self.assertRaises(spec.InvalidType):
             Invalid({"a": "not a string"})
 
+    def test_message(self):
+        with self.assertRaises(spec.InvalidType) as cm:
+            Invalid({"a": "not a string"})
+
+        self.assertIs(cm.exception.model, Invalid)
+        self.assertEqual(cm.exception.value, "not a string")
+        self.assertEqual(str(cm.exception), "Invalid.a expected type int but found str")
+
+    def test_missing_message(self):
+        with self.assertRaises(spec.MissingRequiredKey) as cm:
+            Invalid({})
+
+        self.assertEqual(str(cm.exception), "Missing required key Invalid.a")
+
 class PartA(spec.Model):
     a: int
 
@@ -295,6 +430,46 @@ class UntaggedUnionUsage(unittest.TestCase):
 
         self.assertEqual(self.instance_2.to_dict(), self.INPUT_2)
 
+class PartC(spec.Model):
+    a: str
+
+class UntaggedOverlap(spec.Model):
+    value: int | str | PartA | PartC | list[int]
+
+class UntaggedOverlapUsage(unittest.TestCase):
+    def test_primitives(self):
+        self.assertEqual(UntaggedOverlap({"value": 1}).value, 1)
+        self.assertEqual(UntaggedOverlap({"value": "a"}).value, "a")
+        self.assertEqual(UntaggedOverlap({"value": [1]}).value, [1])
+
+    def test_same_keys(self):
+        self.assertIsInstance(UntaggedOverlap({"value": {"a": 1}}).value, PartA)
+        self.assertIsInstance(UntaggedOverlap({"value": {"a": "1"}}).value, PartC)
+
+    def test_invalid(self):
+        with self.assertRaises(spec.InvalidType):
+            UntaggedOverlap({"value": {"b": 1}})
+
+        with self.assertRaises(spec.InvalidType):
+            UntaggedOverlap({"value": 1.0})
+
+        with self.assertRaises(spec.InvalidType):
+            UntaggedOverlap({"value": ["a"]})
+
+    def test_transparent_variants(self):
+        class Wrapped(spec.Model):
+            x: spec.transparent(list[int]) | str
+            y: spec.transparent(dict[str, int]) | int
+
+        instance = Wrapped({"x": [1, 2], "y": {"a": 1}})
+
+        self.assertEqual(instance.x.value, [1, 2])
+        self.assertEqual(instance.y.value, {"a": 1})
+        self.assertEqual(Wrapped({"x": "a", "y": 1}).to_dict(), {"x": "a", "y": 1})
+
+        with self.assertRaises(spec.InvalidType):
+            Wrapped({"x": ["a"], "y": 1})
+
 ExternallyTaggedPart = spec.transparent(Annotated[PartA | PartB, spec.tag("external")])
 
 class ExternallyTaggedUnionUsage(unittest.TestCase):
@@ -383,19 +558,282 @@ class InternallyTaggedUnionUsage(unittest.TestCase):
         self.assertEqual(repr(self.instance_1), "<PartAOrPartB <PartA a=1>>")
         self.assertEqual(repr(self.instance_2), "<PartAOrPartB <PartB b='data'>>")
 
+class TestUnknownUnionKey(unittest.TestCase):
+    def test_external(self):
+        with self.assertRaises(spec.UnknownUnionKey):
+            ExternallyTaggedPart({"PartC": {"a": 1}})
+
+    def test_internal(self):
+        with self.assertRaises(spec.UnknownUnionKey):
+            InternallyTaggedPart({"type": "PartC", "a": 1})
+
+    def test_unhashable_key(self):
+        with self.assertRaises(spec.UnknownUnionKey):
+            InternallyTaggedPart({"type": ["PartA"], "a": 1})
+
+    def test_variants(self):
+        item = InternallyTaggedPart._items["value"]
+
+        self.assertEqual(list(item.variants), ["PartA", "PartB"])
+
 class TestInvalidTaggedModel(unittest.TestCase):
     def test_fail(self):
         with self.assertRaises(spec.MissingTypeName):
             spec.transparent(int | str, spec.tag("external"))
 
+class Slotted(spec.Model, slots=True):
+    a: int
+    b: Annotated[str, spec.rename("c")] = "c"
+
+class SlottedTagged(spec.Model, slots=True):
+    part: Annotated[PartA | PartB, spec.tag("external")]
+
+class TestSlots(unittest.TestCase):
+    def test_no_dict(self):
+        instance = Slotted({"a": 1})
+
+        self.assertFalse(hasattr(instance, "__dict__"))
+        self.assertEqual(Slotted.__slots__, ("a", "b", "__tag_map__"))
+
+    def test_values(self):
+        instance = Slotted({"a": 1})
+
+        self.assertEqual(instance.a, 1)
+        self.assertEqual(instance.b, "c")
+        self.assertEqual(instance.to_dict(), {"a": 1, "c": "c"})
+        self.assertEqual(repr(instance), "<Slotted a=1 b='c'>")
+
+    def test_tagged(self):
+        instance = SlottedTagged({"part": {"PartB": {"b": "data"}}})
+
+        self.assertEqual(instance.to_dict(), {"part": {"PartB": {"b": "data"}}})
+
+    def test_pickle(self):
+        instance = Slotted({"a": 1, "c": "d"})
+
+        self.assertEqual(pickle.loads(pickle.dumps(instance)), instance)
+
+class TestTagMap(unittest.TestCase):
+    def test_untagged(self):
+        self.assertFalse(Simple._tagged)
+        self.assertNotIn("__tag_map__", vars(Simple({"a": 1, "b": "c"})))
+
+        for instance in (Simple({"a": 1, "b": "c"}), Slotted({"a": 1, "c": "d"}), FrozenSlotted({"a": 1})):
+            with self.subTest(instance=instance):
+                self.assertIs(instance.__tag_map__, spec.model.NO_TAGS)
+                self.assertIs(pickle.loads(pickle.dumps(instance)).__tag_map__, spec.model.NO_TAGS)
+
+    def test_tagged(self):
+        self.assertTrue(SlottedTagged._tagged)
+
+class TestConstruct(unittest.TestCase):
+    def test_round_trip(self):
+        for instance in serializable_instances():
+            with self.subTest(instance=instance):
+                copy = instance.construct(instance.to_dict())
+
+                self.assertEqual(copy, instance)
+                self.assertEqual(copy.to_dict(), instance.to_dict())
+
+    def test_no_validation(self):
+        data = [1, "a"]
+        instance = List.construct({"data": data})
+
+        self.assertIs(instance.data, data)
+
+    def test_defaults(self):
+        self.assertEqual(AnnotatedOptionalWithDefault.construct({}).value, 0)
+        self.assertEqual(MultipleDefaultClsAttr.construct(a=2).b, "b")
+
+    def test_missing(self):
+        with self.assertRaises(spec.MissingRequiredKey):
+            Simple.construct({"a": 1})
+
+    def test_nested(self):
+        instance = UntaggedOverlap.construct({"value": {"a": "1"}})
+
+        self.assertIsInstance(instance.value, PartA)
+        self.assertIsInstance(ListOuter.construct({"inners": [{"value": 1}]}).inners[0], Inner)
+
+    def test_instances(self):
+        inner = Inner({"value": 1})
+        part = PartB({"b": "c"})
+        instance = Assigned.construct({"a": 1, "inner": inner, "part": part})
+
+        self.assertIs(instance.inner, inner)
+        self.assertIs(instance.part, part)
+        self.assertEqual(instance.to_dict()["part"], {"type": "PartB", "b": "c"})
+
+class LazyOuter(spec.Model, lazy=True):
+    name: str
+    inner: Inner
+    inners: list[Inner]
+    part: Annotated[PartA | PartB, spec.tag("external")]
+
+class LazySlotted(spec.Model, lazy=True, slots=True):
+    inner: Inner
+
+class TestLazy(unittest.TestCase):
+    INPUT = {"name": "a", "inner": {"value": 1}, "inners": [{"value": 2}], "part": {"PartB": {"b": "c"}}}
+
+    def test_values(self):
+        instance = LazyOuter(self.INPUT)
+
+        self.assertEqual(vars(instance)["inner"].__class__.__name__, "_Pending")
+        self.assertEqual(instance.inner, Inner({"value": 1}))
+        self.assertIs(instance.inner, instance.inner)
+        self.assertEqual(instance.inners, [Inner({"value": 2})])
+        self.assertEqual(instance.to_dict(), self.INPUT)
+
+    def test_invalid(self):
+        instance = LazyOuter({**self.INPUT, "inners": [{"value": "2"}]})
+
+        self.assertEqual(instance.name, "a")
+
+        with self.assertRaises(spec.InvalidType) as cm:
+            instance.inners
+
+        self.assertEqual(str(cm.exception), "LazyOuter.inners[0].value expected type int but found str")
+
+        with self.assertRaises(spec.InvalidType):
+            instance.inners
+
+    def test_assign(self):
+        instance = LazyOuter(self.INPUT)
+        instance.inner = Inner({"value": 3})
+
+        self.assertEqual(instance.inner.value, 3)
+
+    def test_eq(self):
+        first = LazyOuter(self.INPUT)
+        second = LazyOuter(self.INPUT)
+        first.part
+
+        self.assertEqual(first, second)
+        self.assertEqual(second, first)
+        self.assertNotEqual(first, LazyOuter({**self.INPUT, "part": {"PartA": {"a": 1}}}))
+
+    def test_slotted(self):
+        instance = LazySlotted({"inner": {"value": 1}})
+
+        self.assertEqual(instance.inner, Inner({"value": 1}))
+        self.assertEqual(instance.to_dict(), {"inner": {"value": 1}})
+
+class Frozen(spec.Model, frozen=True):
+    a: int
+    b: list[dict[str, int]]
+
+class FrozenSlotted(spec.Model, frozen=True, slots=True):
+    a: int
+
+class TestEq(unittest.TestCase):
+    def test_eq(self):
+        self.assertEqual(ListOuter({"inners": [{"value": 1}]}), ListOuter({"inners": [{"value": 1}]}))
+        self.assertNotEqual(ListOuter({"inners": [{"value": 1}]}), ListOuter({"inners": [{"value": 2}]}))
+        self.assertNotEqual(ListOuter({"inners": [{"value": 1}]}), Outer({"inner": {"value": 1}}))
+
+    def test_tagged(self):
+        self.assertEqual(ExternallyTaggedPart({"PartA": {"a": 1}}), ExternallyTaggedPart({"PartA": {"a": 1}}))
+        self.assertNotEqual(ExternallyTaggedPart({"PartA": {"a": 1}}), ExternallyTaggedPart({"PartB": {"b": "1"}}))
+
+    def test_unhashable(self):
+        with self.assertRaises(TypeError):
+            hash(Simple({"a": 1, "b": "c"}))
+
+class TestFrozen(unittest.TestCase):
+    INPUT = {"a": 1, "b": [{"c": 1}]}
+
+    def test_assign(self):
+        instance = Frozen(self.INPUT)
+
+        with self.assertRaises(spec.FrozenInstance):
+            instance.a = 2
+
+        with self.assertRaises(AttributeError):
+            del instance.a
+
+        self.assertEqual(instance.a, 1)
+
+    def test_hash(self):
+        instance = Frozen(self.INPUT)
+
+        self.assertEqual(hash(instance), hash(Frozen(self.INPUT)))
+        self.assertEqual(len({instance, Frozen(self.INPUT), Frozen({"a": 2, "b": []})}), 2)
+        self.assertEqual({instance: 1}[Frozen(self.INPUT)], 1)
+
+    def test_slotted(self):
+        instance = FrozenSlotted({"a": 1})
+
+        self.assertEqual(hash(instance), hash(FrozenSlotted({"a": 1})))
+
+        with self.assertRaises(spec.FrozenInstance):
+            instance.a = 2
+
+    def test_pickle(self):
+        for instance in (Frozen(self.INPUT), FrozenSlotted({"a": 1})):
+            hash(instance)
+            copy = pickle.loads(pickle.dumps(instance))
+
+            self.assertEqual(copy, instance)
+            self.assertFalse(hasattr(copy, "__spec_hash__"))
+
+class Forbid(spec.Model, extra="forbid"):
+    a: int
+    b: int = 0
+
+class Collect(spec.Model, extra="collect", slots=True):
+    a: int
+
+class TestExtraKeys(unittest.TestCase):
+    def test_ignore(self):
+        self.assertEqual(Simple({"a": 1, "b": "c", "d": 1}).to_dict(), {"a": 1, "b": "c"})
+
+    def test_forbid(self):
+        self.assertEqual(Forbid({"a": 1}).b, 0)
+
+        with self.assertRaises(spec.UnknownKey) as cm:
+            Forbid({"a": 1, "c": 2, "d": 3})
+
+        self.assertEqual(cm.exception.keys, ["c", "d"])
+        self.assertEqual(str(cm.exception), "Unknown keys Forbid.c, Forbid.d")
+
+    def test_collect(self):
+        instance = Collect({"a": 1, "c": 2})
+
+        self.assertEqual(instance.__extra__, {"c": 2})
+        self.assertEqual(instance.to_dict(), {"a": 1})
+
+    def test_collect_empty(self):
+        self.assertEqual(Collect({"a": 1}).__extra__, {})
+        self.assertEqual(Collect.construct({"a": 1}).__extra__, {})
+        self.assertEqual(Collect.construct({"a": 1, "z": 2}).__extra__, {"z": 2})
+
+    def test_internal_tag(self):
+        class Collected(spec.Model, extra="collect"):
+            a: int
+
+        class Tagged(spec.Model):
+            value: Annotated[Forbid | Collected, spec.tag("internal", tag="t")]
+
+        self.assertEqual(Tagged({"value": {"t": "Forbid", "a": 1}}).to_dict(), {"value": {"a": 1, "b": 0, "t": "Forbid"}})
+        self.assertEqual(Tagged({"value": {"t": "Collected", "a": 1, "c": 2}}).value.__extra__, {"c": 2})
+
+        with self.assertRaises(spec.UnknownKey) as cm:
+            Tagged({"value": {"t": "Forbid", "a": 1, "c": 2}})
+
+        self.assertEqual(str(cm.exception), "Unknown key Tagged.value.c")
+
 class Validation(spec.Model):
     x: Annotated[int, spec.validate(range(10).__contains__)]
 
 class TestValidation(unittest.TestCase):
     def test_invalid_validation(self):
-        with self.assertRaises(spec.FailedValidation):
+        with self.assertRaises(spec.FailedValidation) as cm:
             Validation(x=100)
 
+        self.assertEqual(cm.exception.value, 100)
+        self.assertEqual(str(cm.exception), "Validation.x failed validation")
+
     def test_valid_validation(self):
         Validation(x=5)
 
@@ -416,5 +854,429 @@ class TestGlobalRename(unittest.TestCase):
         with self.assertRaises(spec.MissingRequiredKey):
             GlobalRename(self.INPUT_2)
 
+class Scalars(spec.Model, rename=spec.CamelCase):
+    float_value: float
+    bool_value: bool
+    none_value: Optional[str]
+    text: str
+    int_keys: dict[int, list[float]]
+    tags: set[str]
+
+def serializable_instances() -> list[spec.Model]:
+    return [
+        Simple({"a": 1, "b": "välue \"quoted\""}),
+        Outer({"inner": {"value": 1}}),
+        ListOuter({"inners": [{"value": 1}, {"value": 2}]}),
+        Dict({"data": {"a": 1, "b": 2}}),
+        AnnotatedUsage({"b": 1}),
+        OptionalNotPassed({}),
+        NestedContainers({"data": {"a": [{"value": 1}], "b": []}}),
+        UntaggedPart({"b": "data"}),
+        ExternallyTaggedPart({"PartA": {"a": 1}}),
+        adjacentlyTaggedPart({"type": "PartB", "value": {"b": "data"}}),
+        InternallyTaggedPart({"type": "PartA", "a": 1}),
+        SlottedTagged({"part": {"PartB": {"b": "data"}}}),
+        Scalars({"floatValue": 1.5, "boolValue": True, "noneValue": None, "text": "", "intKeys": {1: [float("inf"), 0.1]}, "tags": set()}),
+    ]
+
+class TestToJson(unittest.TestCase):
+    def test_matches_json_dumps(self):
+        for instance in serializable_instances():
+            with self.subTest(instance=instance):
+                output = instance.to_dict()
+
+                if isinstance(instance, Scalars):
+                    output["tags"] = []
+
+                self.assertEqual(instance.to_json(), json.dumps(output))
+                self.assertEqual(instance.to_json(ensure_ascii=False, separators=(",", ":")), json.dumps(output, ensure_ascii=False, separators=(",", ":")))
+
+    def test_dump_json(self):
+        instances = serializable_instances()[:12]
+        expected = json.dumps([instance.to_dict() for instance in instances])
+
+        self.assertEqual(spec.dump_json(instances), expected)
+
+        fp = io.StringIO()
+        spec.dump_json(instances, fp)
+        self.assertEqual(fp.getvalue(), expected)
+
+        fp = io.BytesIO()
+        spec.dump_json(instances, fp)
+        self.assertEqual(fp.getvalue(), expected.encode())
+
+    def test_not_serializable(self):
+        with self.assertRaises(TypeError):
+            spec.transparent(object)(object()).to_json()
+
+Positive = Annotated[int, spec.validate(lambda x: x > 0)]
+
+class SharedA(spec.Model):
+    value: Positive
+    tags: list[str]
+
+class SharedB(spec.Model, rename=spec.Upper):
+    value: Positive = 1
+    tags: list[str]
+
+class SharedC(spec.Model):
+    other: Positive
+
+class TestSchemaCache(unittest.TestCase):
+    def test_transparent(self):
+        self.assertIs(spec.transparent(list[int]), spec.transparent(list[int]))
+        self.assertIsNot(spec.transparent(list[int]), spec.transparent(list[str]))
+        self.assertIsNot(spec.transparent(int, spec.validate(bool)), spec.transparent(int, spec.validate(bool)))
+
+    def test_shared_items(self):
+        self.assertIs(SharedA._items["tags"].internal_items[0], SharedB._items["TAGS"].internal_items[0])
+        self.assertIs(SharedA._items["value"].validator, SharedB._items["VALUE"].validator)
+
+    def test_copies_are_independent(self):
+        self.assertIsNone(SharedA._items["value"].default)
+        self.assertEqual(SharedB._items["VALUE"].default(), 1)
+        self.assertEqual(SharedA._items["value"].rename, "value")
+        self.assertEqual(SharedC._items["other"].key, "other")
+
+        self.assertEqual(SharedB({"TAGS": []}).value, 1)
+
+        with self.assertRaises(spec.MissingRequiredKey):
+            SharedA({"tags": []})
+
+        with self.assertRaises(spec.FailedValidation) as cm:
+            SharedC({"other": 0})
+
+        self.assertEqual(str(cm.exception), "SharedC.other failed validation")
+
+    def test_union_order(self):
+        class ShapeA(spec.Model):
+            x: int
+
+        class ShapeB(spec.Model):
+            x: int
+
+        class First(spec.Model):
+            v: ShapeA | ShapeB
+
+        class Second(spec.Model):
+            v: ShapeB | ShapeA
+
+        self.assertIsInstance(First({"v": {"x": 1}}).v, ShapeA)
+        self.assertIsInstance(Second({"v": {"x": 1}}).v, ShapeB)
+        self.assertIsInstance(spec.transparent(ShapeB | ShapeA)({"x": 1}).value, ShapeB)
+        self.assertIsInstance(spec.transparent(ShapeA | ShapeB)({"x": 1}).value, ShapeA)
+
+class DeferredInner(spec.Model, defer=True):
+    value: int
+
+class Deferred(spec.Model, defer=True, rename=spec.Upper):
+    inner: DeferredInner | Inner
+    tags: list[str] = []
+
+class DeferredChild(Deferred, defer=True):
+    extra: int
+
+class TestDefer(unittest.TestCase):
+    def test_builds_on_first_use(self):
+        class Unused(spec.Model, defer=True):
+            value: int
+
+        self.assertNotIsInstance(Unused.__dict__["_items"], dict)
+
+        self.assertEqual(Unused({"value": 1}).value, 1)
+        self.assertIsInstance(Unused.__dict__["_items"], dict)
+
+    def test_usage(self):
+        model = Deferred({"INNER": {"value": 1}})
+
+        self.assertIsInstance(model.inner, DeferredInner)
+        self.assertEqual(model.tags, [])
+        self.assertEqual(model.to_dict(), {"INNER": {"value": 1}, "TAGS": []})
+        self.assertEqual(Deferred.construct(model.to_dict()), model)
+
+    def test_subclass(self):
+        Deferred({"INNER": {"value": 1}}).to_dict()
+
+        self.assertEqual(DeferredChild({"extra": 1}).to_dict(), {"extra": 1})
+
+    def test_errors_on_first_use(self):
+        class MissingName(spec.Model, defer=True):
+            value: Annotated[int | str, spec.tag("external")]
+
+        with self.assertRaises(spec.MissingTypeName):
+            MissingName({"value": {"int": 1}})
+
+class PathTagged(spec.Model):
+    parts: dict[str, Annotated[PartA | PartB, spec.tag("external")]]
+
+class PathNested(spec.Model):
+    outers: list[Outer]
+    forbid: list[Forbid] = []
+    tags: set[int] = set()
+    numbers: list[int] = []
+
+class TestErrorPaths(unittest.TestCase):
+    def assertMessage(self, cls: type[spec.Model], data: dict, message: str) -> spec.SpecError:
+        with self.assertRaises(spec.SpecError) as cm:
+            cls(data)
+
+        self.assertEqual(str(cm.exception), message)
+
+        return cm.exception
+
+    def test_list_index(self):
+        error = self.assertMessage(ListOuter, {"inners": [{"value": 1}, {"value": 2}, {"value": "3"}]}, "ListOuter.inners[2].value expected type int but found str")
+
+        self.assertIs(error.model, ListOuter)
+        self.assertEqual(error.path, ["inners", 2, "value"])
+
+    def test_bulk_checks(self):
+        self.assertMessage(PathNested, {"outers": [], "numbers": [1, 2, "3"]}, "PathNested.numbers[2] expected type int but found str")
+        self.assertMessage(PathNested, {"outers": [], "tags": {1, "2"}}, "PathNested.tags expected type int but found str")
+        self.assertMessage(Dict, {"data": {"a": 1, "b": None}}, "Dict.data['b'] expected type int but found NoneType")
+
+    def test_nested_models(self):
+        self.assertMessage(PathNested, {"outers": [{"inner": {"value": 1}}, {"inner": {}}]}, "Missing required key PathNested.outers[1].inner.value")
+        self.assertMessage(PathNested, {"outers": [], "forbid": [{"a": 1, "c": 2}]}, "Unknown key PathNested.forbid[0].c")
+        self.assertMessage(PathNested, {"outers": [{"inner": 1}]}, "PathNested.outers[0].inner expected type Inner but found int")
+
+    def test_tagged_union(self):
+        self.assertMessage(PathTagged, {"parts": {"x": {"PartB": {"b": 1}}}}, "PathTagged.parts['x'].PartB.b expected type str but found int")
+
+    def test_bounded_description(self):
+        data = [*range(100_000), "a"]
+
+        self.assertEqual(spec.util.generate_type_from_data(data), "list[int]")
+        self.assertEqual(spec.util.generate_type_from_data([[[[[1]]]]]), "list[list[list[list[list]]]]")
+
+    def test_args(self):
+        error = self.assertMessage(ListOuter, {"inners": [{"value": "1"}]}, "ListOuter.inners[0].value expected type int but found str")
+
+        self.assertEqual(error.args, ())
+        self.assertEqual(repr(error), "InvalidType('ListOuter.inners[0].value expected type int but found str')")
+
+    def test_pickle(self):
+        error = self.assertMessage(ListOuter, {"inners": [{"value": "1"}]}, "ListOuter.inners[0].value expected type int but found str")
+
+        copy = pickle.loads(pickle.dumps(error))
+
+        self.assertEqual(str(copy), str(error))
+        self.assertEqual(copy.path, error.path)
+        self.assertIs(copy.model, ListOuter)
+
+    def test_pickle_unpicklable(self):
+        class Hooked(spec.Model):
+            value: Annotated[int, spec.validate(lambda value: value > 0)]
+
+        error = self.assertMessage(Hooked, {"value": 0}, "Hooked.value failed validation")
+        copy = pickle.loads(pickle.dumps(error))
+
+        self.assertEqual(str(copy), str(error))
+        self.assertEqual(copy.path, ["value"])
+        self.assertEqual(copy.value, 0)
+        self.assertIsNone(copy.item)
+
+async def known_id(value: int) -> bool:
+    await asyncio.sleep(0)
+
+    return value < 100
+
+async def shout(value: str) -> str:
+    await asyncio.sleep(0)
+
+    return value.upper()
+
+class AsyncInner(spec.Model):
+    id: Annotated[int, spec.validate(known_id)]
+
+class AsyncModel(spec.Model):
+    name: Annotated[str, spec.hook(shout)]
+    ids: list[Annotated[int, spec.validate(known_id)]]
+    inners: dict[str, AsyncInner] = {}
+    part: Annotated[AsyncInner | PartB, spec.tag("external")] = None
+    plain: int = 0
+
+class TestAsync(unittest.IsolatedAsyncioTestCase):
+    INPUT = {"name": "a", "ids": [1, 2], "inners": {"x": {"id": 3}}, "part": {"AsyncInner": {"id": 4}}, "plain": 5}
+
+    async def test_avalidate(self):
+        model = await AsyncModel.avalidate(self.INPUT)
+
+        self.assertEqual(model.name, "A")
+        self.assertEqual(model.ids, [1, 2])
+        self.assertEqual(model.inners["x"].id, 3)
+        self.assertEqual(model.part.id, 4)
+        self.assertEqual(model.plain, 5)
+        self.assertEqual(model.to_dict(), {**self.INPUT, "name": "A"})
+
+    async def test_failures(self):
+        with self.assertRaises(spec.FailedValidation) as cm:
+            await AsyncModel.avalidate({**self.INPUT, "ids": [1, 200]})
+
+        self.assertEqual(str(cm.exception), "AsyncModel.ids[1] failed validation")
+
+        with self.assertRaises(spec.FailedValidation) as cm:
+            await AsyncModel.avalidate({**self.INPUT, "part": {"AsyncInner": {"id": 400}}})
+
+        self.assertEqual(str(cm.exception), "AsyncModel.part.AsyncInner.id failed validation")
+
+        with self.assertRaises(spec.InvalidType):
+            await AsyncModel.avalidate({**self.INPUT, "plain": "a"})
+
+    async def test_instances(self):
+        part = PartB({"b": "c"})
+        inner = await AsyncInner.avalidate({"id": 4})
+
+        model = await AsyncModel.avalidate({**self.INPUT, "part": part})
+
+        self.assertIs(model.part, part)
+        self.assertEqual(model.to_dict()["part"], {"PartB": {"b": "c"}})
+
+        model = await AsyncModel.avalidate({**self.INPUT, "part": inner})
+
+        self.assertIs(model.part, inner)
+        self.assertEqual(model.to_dict()["part"], {"AsyncInner": {"id": 4}})
+
+        with self.assertRaises(spec.InvalidType):
+            await AsyncModel.avalidate({**self.INPUT, "part": Inner({"value": 1})})
+
+    async def test_concurrency_limit(self):
+        running = 0
+        most = 0
+
+        async def slow(value: int) -> bool:
+            nonlocal running, most
+
+            running += 1
+            most = max(most, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+
+            return True
+
+        class Limited(spec.Model):
+            values: list[Annotated[int, spec.validate(slow)]]
+
+        model = await Limited.avalidate({"values": list(range(20))}, max_concurrency=3)
+
+        self.assertEqual(model.values, list(range(20)))
+        self.assertEqual(most, 3)
+
+    async def test_sync_fast_path(self):
+        self.assertFalse(ListOuter._is_async)
+        self.assertEqual(await ListOuter.avalidate({"inners": [{"value": 1}]}), ListOuter({"inners": [{"value": 1}]}))
+
+    def test_sync_constructor(self):
+        with self.assertRaises(TypeError):
+            AsyncModel(self.INPUT)
+
+class Patched(spec.Model, rename=spec.CamelCase):
+    user_name: str
+    inners: list[Inner]
+    part: Annotated[PartA | PartB, spec.tag("external")]
+    either: PartA | PartB
+    count: int = 0
+
+class PatchedForbid(spec.Model, extra="forbid"):
+    a: int
+
+class Assigned(spec.Model, validate_assignment=True):
+    a: int
+    inner: Inner
+    part: Annotated[PartA | PartB, spec.tag("internal", tag="type")]
+
+class TestUpdate(unittest.TestCase):
+    INPUT = {"userName": "a", "inners": [{"value": 1}], "part": {"PartA": {"a": 1}}, "either": {"a": 1}}
+
+    def test_update(self):
+        instance = Patched(self.INPUT)
+        instance.update({"userName": "b", "part": {"PartB": {"b": "c"}}})
+
+        self.assertEqual(instance.user_name, "b")
+        self.assertEqual(instance.part, PartB({"b": "c"}))
+        self.assertEqual(instance.to_dict(), {**self.INPUT, "userName": "b", "part": {"PartB": {"b": "c"}}, "count": 0})
+
+    def test_instances(self):
+        instance = Patched(self.INPUT)
+        part = PartB({"b": "c"})
+        instance.update({"inners": [Inner({"value": 2}), {"value": 3}], "part": part, "either": part})
+
+        self.assertIs(instance.part, part)
+        self.assertIs(instance.either, part)
+        self.assertEqual(instance.inners, [Inner({"value": 2}), Inner({"value": 3})])
+        self.assertEqual(instance.to_dict()["part"], {"PartB": {"b": "c"}})
+
+    def test_invalid(self):
+        instance = Patched(self.INPUT)
+
+        with self.assertRaises(spec.InvalidType) as cm:
+            instance.update({"part": {"PartB": {"b": "c"}}, "inners": [{"value": 1}, {"value": "2"}]})
+
+        self.assertEqual(str(cm.exception), "Patched.inners[1].value expected type int but found str")
+        self.assertEqual(instance.part, PartA({"a": 1}))
+        self.assertEqual(instance.to_dict(), {**self.INPUT, "count": 0})
+
+        with self.assertRaises(spec.InvalidType):
+            instance.update({"part": Inner({"value": 1})})
+
+    def test_extra(self):
+        Patched(self.INPUT).update({"other": 1})
+
+        instance = PatchedForbid({"a": 1})
+
+        with self.assertRaises(spec.UnknownKey):
+            instance.update({"a": 2, "b": 1})
+
+        self.assertEqual(instance.a, 1)
+
+        instance = Collect({"a": 1, "b": 2})
+        instance.update({"a": 2, "c": 3})
+
+        self.assertEqual(instance.a, 2)
+        self.assertEqual(instance.__extra__, {"b": 2, "c": 3})
+
+    def test_frozen(self):
+        with self.assertRaises(spec.FrozenInstance):
+            Frozen(TestFrozen.INPUT).update({"a": 2})
+
+    def test_lazy(self):
+        instance = LazyOuter(TestLazy.INPUT)
+        instance.update({"inners": [{"value": "3"}]})
+
+        with self.assertRaises(spec.InvalidType):
+            instance.inners
+
+class TestValidateAssignment(unittest.TestCase):
+    INPUT = {"a": 1, "inner": {"value": 1}, "part": {"type": "PartA", "a": 1}}
+
+    def test_assign(self):
+        instance = Assigned(self.INPUT)
+        instance.a = 2
+        instance.inner = {"value": 2}
+        instance.part = PartB({"b": "c"})
+        instance._private = object()
+
+        self.assertEqual(instance.inner, Inner({"value": 2}))
+        self.assertEqual(instance.to_dict(), {"a": 2, "inner": {"value": 2}, "part": {"type": "PartB", "b": "c"}})
+
+    def test_invalid(self):
+        instance = Assigned(self.INPUT)
+
+        with self.assertRaises(spec.InvalidType) as cm:
+            instance.inner = {"value": "2"}
+
+        self.assertEqual(str(cm.exception), "Assigned.inner.value expected type int but found str")
+
+        with self.assertRaises(spec.InvalidType):
+            instance.a = "2"
+
+        self.assertEqual(instance.to_dict(), self.INPUT)
+
+    def test_unvalidated(self):
+        instance = Simple({"a": 1, "b": "c"})
+        instance.a = "2"
+
+        self.assertEqual(instance.a, "2")
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,72 @@
+import asyncio
+import io
+import json
+import unittest
+
+import spec
+
+class Inner(spec.Model):
+    value: int
+
+class Record(spec.Model):
+    name: str
+    inners: list[Inner]
+
+RECORDS = [{"name": f"récord {i}", "inners": [{"value": j} for j in range(i)]} for i in range(10)]
+
+class TestIterJson(unittest.TestCase):
+    def test_array(self):
+        fp = io.BytesIO(json.dumps(RECORDS, ensure_ascii=False).encode())
+
+        self.assertEqual(list(spec.iter_json(Record, fp, chunk_size=3)), [Record(record) for record in RECORDS])
+
+    def test_ndjson(self):
+        fp = io.StringIO("\n".join(json.dumps(record) for record in RECORDS) + "\n")
+
+        self.assertEqual(list(spec.iter_json(Record, fp, chunk_size=5)), [Record(record) for record in RECORDS])
+
+    def test_empty_array(self):
+        self.assertEqual(list(spec.iter_json(Record, io.BytesIO(b" [ ] "))), [])
+
+    def test_transparent(self):
+        model = spec.transparent(int)
+
+        self.assertEqual([m.value for m in spec.iter_json(model, io.BytesIO(b"[1, 22, 333]"), chunk_size=1)], [1, 22, 333])
+        self.assertEqual([m.value for m in spec.iter_json(model, io.BytesIO(b"1\n22\n333"), chunk_size=1)], [1, 22, 333])
+
+    def test_invalid_json(self):
+        with self.assertRaises(json.JSONDecodeError):
+            list(spec.iter_json(Record, io.BytesIO(b'[{"name": "a", "inners": []} {}]')))
+
+        with self.assertRaises(json.JSONDecodeError):
+            list(spec.iter_json(Record, io.BytesIO(b'[{"name": "a", "inners": []}')))
+
+    def test_invalid_record(self):
+        with self.assertRaises(spec.InvalidType):
+            list(spec.iter_json(Record, io.BytesIO(b'[{"name": 1, "inners": []}]')))
+
+class TestAiterJson(unittest.TestCase):
+    def test_reader(self):
+        async def run():
+            reader = asyncio.StreamReader()
+            reader.feed_data(json.dumps(RECORDS).encode())
+            reader.feed_eof()
+
+            return [model async for model in spec.aiter_json(Record, reader, chunk_size=7)]
+
+        self.assertEqual(asyncio.run(run()), [Record(record) for record in RECORDS])
+
+    def test_iterable(self):
+        data = json.dumps(RECORDS).encode()
+
+        async def chunks():
+            for i in range(0, len(data), 11):
+                yield data[i:i + 11]
+
+        async def run():
+            return [model async for model in spec.aiter_json(Record, chunks())]
+
+        self.assertEqual(asyncio.run(run()), [Record(record) for record in RECORDS])
+
+if __name__ == "__main__":
+    unittest.main()
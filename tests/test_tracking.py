@@ -0,0 +1,138 @@
+from typing import Annotated, Optional
+import gc
+import pickle
+import unittest
+
+import spec
+
+class Leaf(spec.Model, cache=True, slots=True):
+    id: int
+    tags: list[str]
+
+class Created(spec.Model, cache=True):
+    id: int
+
+class Deleted(spec.Model, cache=True):
+    reason: str
+
+class Key(spec.Model, frozen=True):
+    id: int
+
+class Tree(spec.Model, cache=True, validate_assignment=True):
+    name: str
+    leaves: list[Leaf]
+    groups: dict[str, set[int]]
+    event: Annotated[Created | Deleted, spec.tag("internal", tag="type")]
+    key: Optional[Key] = None
+
+class Plain(spec.Model):
+    id: int
+
+class Untracked(spec.Model, cache=True):
+    plain: Plain
+
+DATA = {
+    "name": "a",
+    "leaves": [{"id": 1, "tags": ["x"]}],
+    "groups": {"g": {1}},
+    "event": {"type": "Created", "id": 1},
+}
+
+class TestCache(unittest.TestCase):
+    def test_cached(self):
+        tree = Tree(DATA)
+        output = tree.to_dict()
+
+        self.assertEqual(output, {**DATA, "key": None})
+        self.assertIs(tree.to_dict(), output)
+        self.assertIs(tree.to_json(), tree.to_json())
+        self.assertEqual(tree.to_json(separators=(",", ":")), Tree(DATA).to_json(separators=(",", ":")))
+        self.assertEqual(tree.event.to_dict(), {"id": 1})
+
+    def test_assignment(self):
+        tree = Tree(DATA)
+        tree.to_dict()
+        tree.name = "b"
+
+        self.assertEqual(tree.to_dict()["name"], "b")
+
+        tree.event = Deleted({"reason": "spam"})
+
+        self.assertEqual(tree.to_dict()["event"], {"reason": "spam", "type": "Deleted"})
+
+        tree.update({"name": "c"})
+
+        self.assertEqual(tree.to_dict()["name"], "c")
+
+    def test_nested(self):
+        tree = Tree(DATA)
+        json = tree.to_json()
+        tree.leaves[0].id = 2
+
+        self.assertEqual(tree.to_dict()["leaves"], [{"id": 2, "tags": ["x"]}])
+        self.assertNotEqual(tree.to_json(), json)
+
+        tree.event.id = 3
+
+        self.assertEqual(tree.to_json(), Tree({**DATA, "leaves": [{"id": 2, "tags": ["x"]}], "event": {"type": "Created", "id": 3}}).to_json())
+
+    def test_containers(self):
+        tree = Tree(DATA)
+        tree.to_dict()
+        tree.leaves[0].tags.append("y")
+        tree.groups["g"].add(2)
+
+        self.assertEqual(tree.to_dict()["leaves"][0]["tags"], ["x", "y"])
+        self.assertEqual(tree.to_dict()["groups"], {"g": {1, 2}})
+
+        tree.leaves.append(Leaf({"id": 2, "tags": []}))
+        tree.to_dict()
+        tree.leaves[1].tags.append("z")
+
+        self.assertEqual(tree.to_dict()["leaves"][1], {"id": 2, "tags": ["z"]})
+        self.assertIs(type(tree.to_dict()["leaves"]), list)
+
+    def test_shared_container(self):
+        first = Leaf({"id": 1, "tags": ["x"]})
+        second = Leaf({"id": 2, "tags": []})
+        first.to_dict()
+        second.tags = first.tags
+        second.to_dict()
+        first.tags.append("y")
+
+        self.assertEqual(first.to_dict()["tags"], ["x", "y"])
+        self.assertEqual(second.to_dict()["tags"], ["x"])
+
+    def test_untracked(self):
+        with self.assertRaises(TypeError):
+            Untracked({"plain": {"id": 1}}).to_dict()
+
+        self.assertEqual(Tree({**DATA, "key": {"id": 1}}).to_dict()["key"], {"id": 1})
+
+    def test_pickle(self):
+        tree = Tree(DATA)
+        tree.to_dict()
+        copy = pickle.loads(pickle.dumps(tree))
+
+        self.assertEqual(copy, tree)
+        self.assertFalse(hasattr(copy, "__spec_cache__"))
+        self.assertIs(type(copy.leaves), list)
+        self.assertEqual(copy.to_dict(), tree.to_dict())
+
+    def test_owners(self):
+        tree = Tree(DATA)
+        leaf = tree.leaves[0]
+        tree.to_dict()
+
+        self.assertEqual(len(leaf.__spec_owners__), 1)
+
+        del tree
+        gc.collect()
+
+        self.assertEqual(leaf.__spec_owners__, {})
+        leaf.id = 2
+
+        self.assertEqual(leaf.to_dict(), {"id": 2, "tags": ["x"]})
+
+if __name__ == "__main__":
+    unittest.main()